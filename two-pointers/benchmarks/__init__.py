@@ -0,0 +1,12 @@
+"""Benchmark suite for the two-pointers solvers.
+
+Run from the ``two-pointers`` directory::
+
+    python -m benchmarks --out results.json
+    python -m benchmarks --baseline baseline.json --threshold 1.5
+
+Each case times one solver across input sizes (10^2 up to ``--max-size``),
+records wall time and peak traced memory, writes the results as JSON, and
+exits with status 1 when a run regresses beyond the threshold against a
+saved baseline.
+"""
@@ -0,0 +1,89 @@
+"""Seeded input generators, one per problem.
+
+Every generator takes the input size `n` and a `random.Random` instance, so
+a given (seed, size) pair always produces the same input.
+"""
+
+import random
+import string
+from typing import List, Tuple
+
+
+def digit_array(n: int, rng: random.Random) -> List[int]:
+    """Random digits 0-9 (create-maximum-number)."""
+    return [rng.randrange(10) for _ in range(n)]
+
+
+def sorted_pair(
+    n: int, rng: random.Random, density: float = 0.1
+) -> Tuple[List[int], List[int]]:
+    """
+    Two strictly increasing arrays of about `n` elements each, where roughly
+    a `density` fraction of the values is shared (get-maximum-score).
+    """
+    nums1: List[int] = []
+    nums2: List[int] = []
+    value = 0
+
+    while len(nums1) < n or len(nums2) < n:
+        value += rng.randint(1, 10)
+        if rng.random() < density:
+            nums1.append(value)
+            nums2.append(value)
+        elif rng.random() < 0.5:
+            nums1.append(value)
+        else:
+            nums2.append(value)
+
+    return nums1[:n], nums2[:n]
+
+
+def list_forest(
+    n: int, rng: random.Random, lists: int = 8, trees: int = 2
+) -> Tuple[List[int], List[int], List[int]]:
+    """
+    About `n` linked-list nodes forming `lists` lists that merge into
+    `trees` separate tails (intersection-two-linked-lists).
+
+    The first `trees` lists end in None; every later list runs over fresh
+    nodes and then joins a random node of an earlier list, so lists share
+    tails at different depths and prefix lengths differ.
+
+    Returns:
+        (values, nexts, heads): node i holds values[i] and points to node
+        nexts[i] (-1 ends a list); heads[k] is the first node of list k.
+    """
+    values = [rng.randint(1, 10**5) for _ in range(n)]
+    nexts: List[int] = []
+    heads: List[int] = []
+    cuts = sorted(rng.sample(range(1, n), min(lists, n) - 1)) if n > 1 else []
+
+    for start, stop in zip([0] + cuts, cuts + [n]):
+        heads.append(start)
+        nexts.extend(range(start + 1, stop))
+        joined = -1 if len(heads) <= trees else rng.randrange(start)
+        nexts.append(joined)
+
+    return values, nexts, heads
+
+
+def numeric_palindrome(n: int, rng: random.Random) -> str:
+    """A random numeric palindrome of length `n` (next-palindrome-same-digits)."""
+    left = "".join(rng.choice(string.digits) for _ in range(n // 2))
+    middle = rng.choice(string.digits) if n % 2 else ""
+    return left + middle + left[::-1]
+
+
+def whitespace_text(n: int, rng: random.Random) -> str:
+    """About `n` characters of space-separated words (reverse-word-string)."""
+    parts = [" " * rng.randint(0, 3)]
+    size = len(parts[0])
+
+    while size < n:
+        length = rng.randint(1, 8)
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+        gap = " " * rng.randint(1, 4)
+        parts.append(word + gap)
+        size += len(word) + len(gap)
+
+    return "".join(parts)[:n]
@@ -0,0 +1,280 @@
+"""Timing, memory tracing and baseline comparison for the benchmark cases."""
+
+import argparse
+import json
+import platform
+import random
+import timeit
+import tracemalloc
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from two_pointers import load_solution
+
+from . import generators
+
+DEFAULT_SIZES = [10**p for p in range(2, 8)]
+
+# Times per call below this many seconds are never reported as regressions
+TIME_FLOOR = 1e-5
+
+
+class Case(NamedTuple):
+    """
+    One benchmarked function.
+
+    `setup(module, n, rng)` builds the input outside the measurement and
+    returns the zero-argument callable that is timed. Sizes above
+    `max_size` are skipped (e.g. for quadratic reference engines).
+    """
+
+    name: str
+    problem: str
+    setup: Callable[[ModuleType, int, random.Random], Callable[[], Any]]
+    max_size: int = 10**7
+
+
+def _max_subsequence(mod, n, rng):
+    nums = generators.digit_array(n, rng)
+    return lambda: mod.max_subsequence(nums, n // 2)
+
+
+def _max_subsequence_upgrade(mod, n, rng):
+    nums = generators.digit_array(n, rng)
+    return lambda: mod.max_subsequence(nums, n // 2, mode="upgrade")
+
+
+def _merge_inputs(mod, n, rng):
+    # Best subsequences, as `max_number` merges them: long runs of 9s and ties
+    a = mod.max_subsequence(generators.digit_array(2 * n, rng), n // 2)
+    b = mod.max_subsequence(generators.digit_array(2 * n, rng), n // 2)
+    return a, b
+
+
+def _merge(mod, n, rng):
+    a, b = _merge_inputs(mod, n, rng)
+    return lambda: mod.merge(a, b)
+
+
+def _merge_reference(mod, n, rng):
+    a, b = _merge_inputs(mod, n, rng)
+    return lambda: mod.merge_reference(a, b)
+
+
+def _max_number_inputs(n, rng):
+    # k = n from two arrays of 2n digits: n + 1 splits of n digits each
+    return generators.digit_array(2 * n, rng), generators.digit_array(2 * n, rng)
+
+
+def _max_number(mod, n, rng):
+    nums1, nums2 = _max_number_inputs(n, rng)
+    return lambda: mod.max_number(nums1, nums2, n)
+
+
+def _max_number_reference(mod, n, rng):
+    nums1, nums2 = _max_number_inputs(n, rng)
+    return lambda: mod.max_number_reference(nums1, nums2, n)
+
+
+def _maxsum(mod, n, rng):
+    nums1, nums2 = generators.sorted_pair(n, rng)
+    return lambda: mod.maxsum(nums1, nums2)
+
+
+def _maxsum_chunked(mod, n, rng):
+    nums1, nums2 = generators.sorted_pair(n, rng)
+    return lambda: mod.maxsum_chunked(iter(nums1), iter(nums2))
+
+
+def _intersection(mod, n, rng):
+    values, nexts, heads = generators.list_forest(n, rng)
+    nodes = [mod.ListNode(v) for v in values]
+    for node, nxt in zip(nodes, nexts):
+        if nxt >= 0:
+            node.next = nodes[nxt]
+    head_a, head_b = nodes[heads[-2]], nodes[heads[-1]]
+    return lambda: mod.get_intersection_node(head_a, head_b)
+
+
+def _intersection_pool(mod, n, rng):
+    values, nexts, heads = generators.list_forest(n, rng)
+    pool = mod.NodePool()
+    pool.vals.extend(values)
+    pool.nexts.extend(nexts)
+    head_a, head_b = heads[-2], heads[-1]
+    return lambda: mod.get_intersection_index(pool, head_a, head_b)
+
+
+def _next_palindrome(mod, n, rng):
+    num_str = generators.numeric_palindrome(n, rng)
+    return lambda: mod.find_next_palindrome(num_str)
+
+
+def _next_palindrome_reference(mod, n, rng):
+    num_str = generators.numeric_palindrome(n, rng)
+    return lambda: mod.find_next_palindrome_reference(num_str)
+
+
+def _reverse_words(mod, n, rng):
+    sentence = generators.whitespace_text(n, rng)
+    return lambda: mod.reverse_words(sentence)
+
+
+def _reverse_words_bytes(mod, n, rng):
+    data = generators.whitespace_text(n, rng).encode()
+    return lambda: mod.reverse_words_bytes(data)
+
+
+CASES = [
+    Case("max_subsequence", "create-maximum-number", _max_subsequence),
+    Case(
+        "max_subsequence[upgrade]",
+        "create-maximum-number",
+        _max_subsequence_upgrade,
+        max_size=10**3,
+    ),
+    Case("merge", "create-maximum-number", _merge, max_size=10**5),
+    Case(
+        "merge_reference",
+        "create-maximum-number",
+        _merge_reference,
+        max_size=10**4,
+    ),
+    Case("max_number", "create-maximum-number", _max_number, max_size=10**4),
+    Case(
+        "max_number_reference",
+        "create-maximum-number",
+        _max_number_reference,
+        max_size=10**3,
+    ),
+    Case("maxsum", "get-maximum-score", _maxsum),
+    Case("maxsum_chunked", "get-maximum-score", _maxsum_chunked),
+    Case("get_intersection_node", "intersection-two-linked-lists", _intersection),
+    Case(
+        "get_intersection_index",
+        "intersection-two-linked-lists",
+        _intersection_pool,
+    ),
+    Case("find_next_palindrome", "next-palindrome-same-digits", _next_palindrome),
+    Case(
+        "find_next_palindrome_reference",
+        "next-palindrome-same-digits",
+        _next_palindrome_reference,
+    ),
+    Case("reverse_words", "reverse-word-string", _reverse_words),
+    Case("reverse_words_bytes", "reverse-word-string", _reverse_words_bytes),
+]
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Best time per call over `repeat` timed runs, then peak traced memory of
+    one more call (tracing slows execution, so it is kept out of the timed
+    runs). Each timed run loops `fn` for at least `timeit`'s autorange
+    duration (0.2 s), so microsecond calls are not timed one by one.
+    """
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    runs = [elapsed] + timer.repeat(repeat=max(repeat - 1, 0), number=number)
+    best = min(runs) / number
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def run(
+    sizes: List[int], seed: int = 0, repeat: int = 3, only: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Run every case (or those whose name contains `only`) at every size."""
+    results = []
+    for case in CASES:
+        if only and only not in case.name:
+            continue
+        module = load_solution(case.problem)
+
+        for n in sizes:
+            if n > case.max_size:
+                continue
+            fn = case.setup(module, n, random.Random(seed))
+            # Fewer repetitions for the largest inputs
+            stats = measure(fn, repeat if n <= 10**5 else 1)
+            results.append({"case": case.name, "size": n, **stats})
+            print(
+                f"{case.name:<32} n={n:<9} {stats['seconds']:.6f}s "
+                f"peak={stats['peak_bytes']:,}B",
+                flush=True,
+            )
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    threshold: float,
+    floor: float = TIME_FLOOR,
+) -> List[str]:
+    """
+    Describe every (case, size) whose time or peak memory exceeds
+    `threshold` times the baseline. Times below `floor` seconds are too
+    close to timer resolution to gate on, and runs missing from either
+    side are ignored.
+    """
+    previous = {(r["case"], r["size"]): r for r in baseline}
+    regressions = []
+
+    for r in results:
+        old = previous.get((r["case"], r["size"]))
+        if old is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if metric == "seconds" and r[metric] < floor:
+                continue
+            if old[metric] > 0 and r[metric] > threshold * old[metric]:
+                regressions.append(
+                    f"{r['case']} n={r['size']}: {metric} "
+                    f"{old[metric]:.6g} -> {r[metric]:.6g}"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--max-size", type=int, default=10**5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", help="run cases whose name contains this text")
+    parser.add_argument("--out", type=Path, help="write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare to")
+    parser.add_argument("--threshold", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    sizes = [n for n in DEFAULT_SIZES if n <= args.max_size]
+    results = run(sizes, seed=args.seed, repeat=args.repeat, only=args.only)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+
+    return 0
@@ -1,13 +1,106 @@
-from typing import List
+import concurrent.futures
+import re
+from array import array
+from bisect import bisect_left
+from collections import deque
+from itertools import chain, count, repeat
+from operator import add, mul
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
 
+# NumPy is optional, and imported by `_numpy()` on first use only
+np = None
+_numpy_tried = False
 
-def max_subsequence(nums: List[int], k: int) -> List[int]:
+
+def _numpy():
+    """The NumPy module, imported on the first call; None if not installed."""
+    global np, _numpy_tried
+    if not _numpy_tried:
+        _numpy_tried = True
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover - NumPy is optional
+            pass
+    return np
+
+
+def max_subsequence(nums: List[int], k: int, mode: str = "stack") -> List[int]:
     """
     Return the lexicographically largest subsequence of length `k` from `nums`,
     preserving the original order of digits.
 
-    This implementation uses a greedy "upgrade" strategy rather than the
-    classical monotonic-stack approach.
+    Two engines are available:
+        - "stack"   : classical monotonic stack, O(n). This is the default.
+        - "upgrade" : the original greedy "upgrade" strategy, kept as the
+                      reference implementation (see `_max_subsequence_upgrade`).
+
+    Args:
+        nums : List[int]
+            The source sequence of digits.
+        k : int
+            Desired length of the output subsequence.
+        mode : str
+            Engine to use, either "stack" or "upgrade".
+
+    Returns:
+        List[int] : The lexicographically largest subsequence of length `k`.
+
+    Raises:
+        ValueError: If `mode` is not a known engine.
+    """
+    if mode == "stack":
+        return _max_subsequence_stack(nums, k)
+    if mode == "upgrade":
+        return _max_subsequence_upgrade(nums, k)
+    raise ValueError(f"unknown max_subsequence mode: {mode!r}")
+
+
+def _max_subsequence_stack(nums: List[int], k: int) -> List[int]:
+    """
+    Monotonic-stack engine for `max_subsequence`.
+
+    Algorithm overview:
+        1. We may discard exactly `len(nums) - k` digits.
+        2. For each digit `x`, while discards remain and the top of the stack
+           is smaller than `x`, pop it: a larger digit earlier always wins.
+        3. Push `x`. The first `k` entries of the stack are the answer.
+
+    Time complexity:
+        O(n), since every digit is pushed and popped at most once.
+    """
+    # Edge cases
+    if k <= 0:
+        return []
+    if k >= len(nums):
+        return nums[:]
+
+    # Number of digits we are still allowed to throw away
+    drop = len(nums) - k
+    stack: List[int] = []
+
+    for digit in nums:
+        while drop and stack and stack[-1] < digit:
+            stack.pop()
+            drop -= 1
+        stack.append(digit)
+
+    # Any unused discards fall off the (non-increasing) tail
+    return stack[:k]
+
+
+def _max_subsequence_upgrade(nums: List[int], k: int) -> List[int]:
+    """
+    Reference "upgrade" engine for `max_subsequence`.
 
     Algorithm overview:
         1. Initialize the subsequence using the first `k` digits of `nums`.
@@ -21,17 +114,9 @@ def max_subsequence(nums: List[int], k: int) -> List[int]:
 
 
     Time complexity:
-        O((n - k) * k), since each of the (n - k) remaining digits generates
-        up to `k` candidate sequences for comparison.
-
-    Args:
-        nums : List[int]
-            The source sequence of digits.
-        k : int
-            Desired length of the output subsequence.
-
-    Returns:
-        List[int] : The lexicographically largest subsequence of length `k`.
+        O((n - k) * k^2), since each of the (n - k) remaining digits generates
+        up to `k` candidate sequences, and building and comparing each
+        candidate costs O(k).
     """
     # Edge cases
     if k <= 0:
@@ -63,35 +148,211 @@ def max_subsequence(nums: List[int], k: int) -> List[int]:
     return sub
 
 
+def max_subsequences_all(
+    nums: List[int],
+    k_max: Optional[int] = None,
+    k_min: int = 0,
+    ascending: bool = False,
+) -> Iterator[Tuple[int, List[int]]]:
+    """
+    Yield `(k, max_subsequence(nums, k))` for every length k_min..k_max.
+
+    The best subsequence of length k - 1 is obtained from the best one of
+    length k by deleting the first digit that is smaller than its successor
+    (or the last digit if the sequence is non-increasing). After deleting
+    position p, the prefix before p is still non-increasing, so the next
+    search resumes at p - 1 instead of the start: the scan pointer moves
+    O(n) steps in total over all lengths.
+
+    Only one working sequence is kept, so memory stays O(n) however many
+    lengths are produced. The yielded list is that working sequence and
+    changes when the generator resumes: copy it to keep it.
+
+    Lengths come in descending order, the order of the deletions. With
+    `ascending=True` the deletions are recorded first and then undone one
+    by one, re-inserting each digit at its original position.
+
+    Args:
+        nums : List[int]
+            The source sequence of digits.
+        k_max : Optional[int]
+            Largest length wanted. Defaults to len(nums).
+        k_min : int
+            Smallest length wanted.
+        ascending : bool
+            Yield the lengths from k_min up instead of from k_max down.
+
+    Yields:
+        Tuple[int, List[int]] : the length k and the best subsequence of
+        that length.
+    """
+    if k_max is None or k_max > len(nums):
+        k_max = len(nums)
+    k_min = max(k_min, 0)
+    if k_max < k_min:
+        return
+
+    seq = _max_subsequence_stack(nums, k_max)
+    # Position in the length-k_max sequence of every digit still in `seq`
+    slots = list(range(k_max))
+    deleted: List[Tuple[int, int]] = []
+
+    p = 0
+    for k in range(k_max, k_min, -1):
+        if not ascending:
+            yield k, seq
+
+        # Advance to the first "valley": seq[p] < seq[p + 1]
+        while p + 1 < len(seq) and seq[p] >= seq[p + 1]:
+            p += 1
+
+        if ascending:
+            deleted.append((slots.pop(p), seq.pop(p)))
+        else:
+            del seq[p]
+
+        # The only new adjacent pair is (p - 1, p)
+        if p > 0:
+            p -= 1
+
+    yield k_min, seq
+
+    # Undo the deletions, most recent first
+    for k, (slot, digit) in enumerate(reversed(deleted), k_min + 1):
+        at = bisect_left(slots, slot)
+        slots.insert(at, slot)
+        seq.insert(at, digit)
+        yield k, seq
+
+
+# How `merge` and `iter_merge` break ties: a common prefix of up to PEEK
+# digits is walked in place; a longer one ranks every remaining suffix once
+PEEK = 8
+
+# `_suffix_ranks` starts from the first RANK_SEED values of every suffix
+RANK_SEED = 64
+
+
+def _suffix_ranks(a: List[int], b: List[int]) -> List[int]:
+    """
+    Rank every suffix of `a + [sentinel] + b` by prefix doubling.
+
+    `rank[i] > rank[len(a) + 1 + j]` exactly when a[i:] > b[j:] (or when
+    the two are equal, where either choice merges to the same digits).
+    The sentinel ranks below every digit, so a suffix of `a` that is a
+    proper prefix of one of `b` compares smaller, as list comparison does;
+    a suffix of `b` ends the string and is smaller than any extension.
+
+    The first ranks order the suffixes by their first RANK_SEED values,
+    compared as bytes (values are renumbered to fit). Each round then
+    ranks them by their first 2h values, from the pair (rank of the first
+    h, rank of the next h) packed into one int, and stops as soon as all
+    ranks are distinct: O(N log N) with C-level sorting, mapping and dict
+    lookups.
+    """
+    values = {v: r for r, v in enumerate(sorted(set(a) | set(b)), 2)}
+    n = len(a) + 1 + len(b)
+    if len(values) < 255:
+        text = bytes(map(values.__getitem__, a)) + b"\x01"
+        text += bytes(map(values.__getitem__, b))
+        h = min(RANK_SEED, n)
+        seeds = [text[p : p + h] for p in range(n)]
+    else:
+        h = 1
+        seeds = list(map(values.__getitem__, a))
+        seeds.append(1)
+        seeds.extend(map(values.__getitem__, b))
+
+    distinct = sorted(set(seeds))
+    rank = list(map(dict(zip(distinct, count(1))).__getitem__, seeds))
+    while len(distinct) < n and h < n:
+        # 0 past the end: a shorter suffix ranks below its extensions
+        high = map(mul, rank, repeat(n + 1))
+        keys = list(map(add, high, chain(rank[h:], repeat(0, h))))
+        distinct = sorted(set(keys))
+        rank = list(map(dict(zip(distinct, count(1))).__getitem__, keys))
+        h *= 2
+    return rank
+
+
+def merge_reference(a: List[int], b: List[int]) -> List[int]:
+    """
+    Reference `merge`: compares the remaining suffixes as slices at every
+    step, O(k^2) time and allocation.
+    """
+    i = j = 0
+    result = []
+
+    while i < len(a) and j < len(b):
+        if a[i:] > b[j:]:
+            result.append(a[i])
+            i += 1
+        else:
+            result.append(b[j])
+            j += 1
+
+    result.extend(a[i:])
+    result.extend(b[j:])
+    return result
+
+
 def merge(a: List[int], b: List[int]) -> List[int]:
     """
     Merge two digit sequences a and b into the lexicographically largest possible result.
     We do this by always choosing the next digit from the sequence whose *remaining suffix*
     is lexicographically larger.
 
+    Same result as `merge_reference`, without building a suffix per step:
+    ties are broken as in `iter_merge`.
+
     Example:
         a = [6,7]
         b = [6,0,4]
         Comparing suffixes:
             [6,7] > [6,0,4]  -> pick from a
     """
-    # pointers for a and b
     i = j = 0
+    n, m = len(a), len(b)
 
     # result sequence
     result = []
+    append = result.append
 
-    # While both lists still have digits available
-    while i < len(a) and j < len(b):
+    # While both lists still have digits available: the loop of `iter_merge`
+    while i < n and j < m:
+        x, y = a[i], b[j]
+        if x != y:
+            take_a = x > y
+        else:
+            d, limit = 1, min(n - i, m - j, PEEK)
+            while d < limit and a[i + d] == b[j + d]:
+                d += 1
+            if d < limit:
+                take_a = a[i + d] > b[j + d]
+            elif d == n - i or d == m - j:
+                take_a = n - i > m - j
+            else:
+                break
 
-        # Compare lexicographically the remaining suffixes
-        if a[i:] > b[j:]:
-            result.append(a[i])  # choose digit from a
+        if take_a:
+            append(x)  # choose digit from a
             i += 1
         else:
-            result.append(b[j])  # choose digit from b
+            append(y)  # choose digit from b
             j += 1
 
+    if i < n and j < m:
+        rank = _suffix_ranks(a[i:], b[j:])
+        offset = n - i + 1 - j
+        base = i
+        while i < n and j < m:
+            if rank[i - base] > rank[offset + j]:
+                append(a[i])
+                i += 1
+            else:
+                append(b[j])
+                j += 1
+
     # One of the lists ended. Append whatever remains.
     result.extend(a[i:])
     result.extend(b[j:])
@@ -99,7 +360,193 @@ def merge(a: List[int], b: List[int]) -> List[int]:
     return result
 
 
-def max_number(nums1: List[int], nums2: List[int], k: int) -> List[int]:
+def iter_merge(a: List[int], b: List[int]) -> Iterator[int]:
+    """
+    Lazily yield the digits of `merge(a, b)` one at a time.
+
+    Lets callers stop consuming a merge as soon as its prefix is known to be
+    worse than a competing candidate.
+
+    Different current digits decide a step at once, and a tie is walked in
+    place for up to `PEEK` digits. The first tie that the peek cannot
+    settle ranks every remaining suffix with `_suffix_ranks`, and each
+    further step takes O(1). No suffix is ever copied per step; merges of
+    random digits, and merges abandoned early, usually never rank at all.
+    """
+    i = j = 0
+    n, m = len(a), len(b)
+
+    while i < n and j < m:
+        x, y = a[i], b[j]
+        if x != y:
+            take_a = x > y
+        else:
+            d, limit = 1, min(n - i, m - j, PEEK)
+            while d < limit and a[i + d] == b[j + d]:
+                d += 1
+            if d < limit:
+                take_a = a[i + d] > b[j + d]
+            elif d == n - i or d == m - j:
+                take_a = n - i > m - j  # the exhausted suffix is smaller
+            else:
+                break
+
+        if take_a:
+            yield x
+            i += 1
+        else:
+            yield y
+            j += 1
+
+    if i < n and j < m:
+        # Rank what is left only; ranks are indexed from (i, j)
+        rank = _suffix_ranks(a[i:], b[j:])
+        offset = n - i + 1 - j
+        base = i
+        while i < n and j < m:
+            if rank[i - base] > rank[offset + j]:
+                yield a[i]
+                i += 1
+            else:
+                yield b[j]
+                j += 1
+
+    yield from a[i:]
+    yield from b[j:]
+
+
+# Compiled patterns matching one byte <= v, built on first use
+_AT_MOST: Dict[int, Pattern[bytes]] = {}
+
+
+def _find_at_most(data: bytes, v: int, pos: int) -> int:
+    """Index of the first byte <= v in data[pos:], or len(data) if none is."""
+    if v < 0:
+        return len(data)
+    pattern = _AT_MOST.get(v)
+    if pattern is None:
+        pattern = re.compile(b"[\\x00-" + re.escape(bytes([v])) + b"]")
+        _AT_MOST[v] = pattern
+    match = pattern.search(data, pos)
+    return match.start() if match else len(data)
+
+
+def _merge_pieces(a: bytes, b: bytes, top: int) -> Iterator[bytes]:
+    """
+    Yield the digits of `merge(a, b)` as consecutive pieces of bytes.
+
+    A head larger than the other one is yielded together with every
+    following digit that is still larger, found by one regex scan. Two
+    heads equal to `top` (no digit is larger) are both yielded up to the
+    end of their runs of `top`: the order between them cannot change the
+    result. Other ties are peeked at as in `iter_merge`, and a tie the peek
+    cannot settle hands what is left to `iter_merge` itself.
+    """
+    i = j = 0
+    n, m = len(a), len(b)
+
+    while i < n and j < m:
+        x, y = a[i], b[j]
+        if x > y:
+            end = _find_at_most(a, y, i)
+            yield a[i:end]
+            i = end
+        elif y > x:
+            end = _find_at_most(b, x, j)
+            yield b[j:end]
+            j = end
+        elif x == top:
+            end_a = _find_at_most(a, top - 1, i)
+            end_b = _find_at_most(b, top - 1, j)
+            yield a[i:end_a] + b[j:end_b]
+            i, j = end_a, end_b
+        else:
+            d, limit = 1, min(n - i, m - j, PEEK)
+            while d < limit and a[i + d] == b[j + d]:
+                d += 1
+            if d < limit:
+                take_a = a[i + d] > b[j + d]
+            elif d == n - i or d == m - j:
+                take_a = n - i > m - j
+            else:
+                yield bytes(iter_merge(list(a[i:]), list(b[j:])))
+                return
+
+            if take_a:
+                yield a[i : i + 1]
+                i += 1
+            else:
+                yield b[j : j + 1]
+                j += 1
+
+    yield a[i:] + b[j:]
+
+
+def _best_in_splits(
+    nums1: List[int], nums2: List[int], k: int, lo: int, hi: int
+) -> List[int]:
+    """
+    Return the best merged number over the splits i = lo..hi, where `i` digits
+    come from nums1 and `k - i` from nums2.
+
+    Each candidate is streamed in pieces with `_merge_pieces` and every
+    piece is compared with the same stretch of the current best as bytes,
+    in C; the split is abandoned at the first piece that falls below it.
+    Candidates usually lose within their leading run of 9s, which is a
+    single piece. Values that do not fit a byte materialise every
+    candidate with `merge` instead.
+    """
+    # Best subsequences of the lengths in this range only, one working
+    # sequence per array: i grows from lo while k - i shrinks
+    subs1 = max_subsequences_all(nums1, hi, lo, ascending=True)
+    subs2 = max_subsequences_all(nums2, k - lo, k - hi)
+    pairs = zip(subs1, subs2)
+
+    values = set(nums1) | set(nums2)
+    if min(values, default=0) < 0 or max(values, default=0) > 255:
+        return max(merge(sub1, sub2) for (_, sub1), (_, sub2) in pairs)
+    top = max(values, default=0)
+
+    best = b""
+    for (_, sub1), (_, sub2) in pairs:
+        pieces = _merge_pieces(bytes(sub1), bytes(sub2), top)
+
+        # First candidate is taken as-is
+        if not best:
+            best = b"".join(pieces)
+            continue
+
+        # Walk the common prefix with the current best, a piece at a time
+        t = 0
+        for piece in pieces:
+            end = t + len(piece)
+            same = best[t:end]
+            if piece != same:
+                # Strictly better: finish materializing this candidate
+                if piece > same:
+                    best = best[:t] + piece + b"".join(pieces)
+                break  # otherwise the prefix fell below the best: prune
+            t = end
+
+    return list(best)
+
+
+def max_number_reference(nums1: List[int], nums2: List[int], k: int) -> List[int]:
+    """
+    Reference `max_number`: builds and merges both subsequences of every
+    split in full and keeps the largest, O(k) merges of O(k) digits.
+    """
+    best = []
+    for i in range(max(0, k - len(nums2)), min(k, len(nums1)) + 1):
+        merged = merge(max_subsequence(nums1, i), max_subsequence(nums2, k - i))
+        if merged > best:
+            best = merged
+    return best
+
+
+def max_number(
+    nums1: List[int], nums2: List[int], k: int, workers: Optional[int] = None
+) -> List[int]:
     """
     Combine digits from nums1 and nums2 to form the largest possible number
     of length k while preserving the relative order of digits in each array.
@@ -110,41 +557,367 @@ def max_number(nums1: List[int], nums2: List[int], k: int) -> List[int]:
       - For each split:
            1. Extract the best subsequence of size i from nums1.
            2. Extract the best subsequence of size k-i from nums2.
-           3. Merge the two subsequences into the lexicographically largest result.
+           3. Merge the two subsequences in pieces, abandoning the split as
+              soon as its prefix falls below the best found so far.
            4. Track the best merged sequence overall.
+      - With `workers` > 1 the splits are divided into contiguous ranges and
+        searched in a process pool; the best result of each range is kept.
     """
     n, m = len(nums1), len(nums2)
 
-    # Track the best merged result and its numeric value
-    best = []
-
     # Try all possible ways to choose i digits from nums1
     # i ranges from:
     #   max(0, k - m)  => minimum digits needed from nums1
     #   to
     #   min(k, n)      => cannot take more than nums1 length
-    for i in range(max(0, k - m), min(k, n) + 1):
+    lo, hi = max(0, k - m), min(k, n)
+    if lo > hi:
+        return []
 
-        # Best subsequence of length i from nums1
-        left = max_subsequence(nums1, i)
+    splits = hi - lo + 1
+    if not workers or workers <= 1 or splits < 2:
+        return _best_in_splits(nums1, nums2, k, lo, hi)
 
-        # Best subsequence of length k - i from nums2
-        right = max_subsequence(nums2, k - i)
+    # Contiguous split ranges, one or more per worker
+    chunks = min(workers, splits)
+    step = -(-splits // chunks)
+    ranges = [(s, min(s + step - 1, hi)) for s in range(lo, hi + 1, step)]
 
-        # Merge to get the best possible number for this split
-        merged = merge(left, right)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=chunks) as pool:
+        futures = [
+            pool.submit(_best_in_splits, nums1, nums2, k, r_lo, r_hi)
+            for r_lo, r_hi in ranges
+        ]
+        results = [f.result() for f in futures]
 
-        # Update global best if this merged result is larger
-        if merged > best:
-            best = merged
+    # All candidates have length k, so list comparison picks the largest
+    return max(results)
+
+
+# ------------------------------------------------------------
+# STREAMING API
+# ------------------------------------------------------------
+class MaxSubsequenceStream:
+    """
+    Online version of `max_subsequence` over an unbounded digit feed.
+
+    Keeps the best length-`k` subsequence of every digit pushed so far,
+    using O(k) memory and amortized O(1) work per digit.
+
+    When a new digit arrives on a full subsequence, the best candidate is to
+    delete the first "valley" (a digit smaller than its successor) and append
+    the new digit; if the subsequence is non-increasing, the new digit only
+    replaces the last one when it is larger. The digits live in a doubly
+    linked list over fixed-size slot arrays, and the valleys are kept in
+    order in a deque: new valleys only appear right before the deleted one
+    or at the tail, so both ends of the deque suffice.
+
+    Example:
+        stream = MaxSubsequenceStream(2)
+        stream.extend([3, 9, 5])
+        stream.current()  # [9, 5]
+    """
+
+    def __init__(self, k: int) -> None:
+        self.k = max(k, 0)
+        slots = self.k + 1
+        self._val = [0] * slots
+        self._prev = [-1] * slots
+        self._next = [-1] * slots
+        self._free = list(range(slots))
+        self._head = self._tail = -1
+        self._size = 0
+        self._valleys: Deque[int] = deque()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, digit: int) -> None:
+        """Feed one digit into the stream."""
+        if self.k == 0:
+            return
+
+        if self._size == self.k:
+            if self._valleys:
+                # Delete the first valley and append the new digit
+                self._unlink(self._valleys.popleft())
+            elif digit > self._val[self._tail]:
+                # Non-increasing: the new digit replaces a smaller last digit
+                self._unlink(self._tail)
+            else:
+                return
+
+        self._append(digit)
+
+    def extend(self, digits: Iterable[int]) -> None:
+        """Feed every digit of an iterable into the stream."""
+        for digit in digits:
+            self.push(digit)
+
+    def current(self) -> List[int]:
+        """Return the best subsequence of the digits seen so far."""
+        out = []
+        node = self._head
+        while node != -1:
+            out.append(self._val[node])
+            node = self._next[node]
+        return out
+
+    def _append(self, digit: int) -> None:
+        node = self._free.pop()
+        self._val[node] = digit
+        self._prev[node] = self._tail
+        self._next[node] = -1
+
+        if self._tail == -1:
+            self._head = node
+        else:
+            self._next[self._tail] = node
+            # The only new adjacent pair is (old tail, node)
+            if self._val[self._tail] < digit:
+                self._valleys.append(self._tail)
+
+        self._tail = node
+        self._size += 1
+
+    def _unlink(self, node: int) -> None:
+        before, after = self._prev[node], self._next[node]
+
+        if before == -1:
+            self._head = after
+        else:
+            self._next[before] = after
+        if after == -1:
+            self._tail = before
+        else:
+            self._prev[after] = before
+
+        # `before` precedes every remaining valley, so it goes to the front
+        if before != -1 and after != -1 and self._val[before] < self._val[after]:
+            self._valleys.appendleft(before)
+
+        self._free.append(node)
+        self._size -= 1
+
+
+# ------------------------------------------------------------
+# BATCH API
+# ------------------------------------------------------------
+# Number of queries from which the NumPy engine beats a loop over max_number
+NUMPY_MIN_QUERIES = 512
+
+
+def _pack_rows(seqs):
+    """
+    Pack digit sequences into a (R, L + 1) int8 array padded with -1 (NumPy).
+
+    The digits are joined into one flat buffer and scattered by offset, so
+    no per-row NumPy call is made. The extra column keeps every row padded.
+    """
+    lengths = np.fromiter(map(len, seqs), dtype=np.int64, count=len(seqs))
+    flat = np.frombuffer(bytes(chain.from_iterable(seqs)), dtype=np.int8)
+    width = int(lengths.max()) if len(seqs) else 0
+    packed = np.full((len(seqs), width + 1), -1, dtype=np.int8)
+    rows = np.repeat(np.arange(len(seqs)), lengths)
+    cols = np.arange(len(flat)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    packed[rows, cols] = flat
+    return packed, lengths
+
+
+def _batch_keep_from(digits, lengths):
+    """
+    One monotonic-stack pass over every row at once (NumPy).
+
+    Popping without a budget deletes digits in the order of the
+    all-lengths chain (see `max_subsequences_all`): first the popped
+    digits, then what is left on the stack, from the top down. So
+    max_subsequence(row, k) is the digits whose deletion comes last k,
+    in order.
+
+    Returns:
+        (R, L + 1) int32 array `keep`: digit p of row r belongs to
+        max_subsequence(row r, k) iff keep[r, p] <= k. Padding never does.
+    """
+    rows, stride = digits.shape
+    stack = np.zeros((rows, stride), dtype=np.int64)  # positions
+    top = np.zeros(rows, dtype=np.int64)
+    deleted = np.zeros(rows, dtype=np.int64)
+    order = np.zeros((rows, stride), dtype=np.int64)  # deletion order
+    idx = np.arange(rows)
+
+    for p in range(stride - 1):
+        live = idx[p < lengths]
+        cand, digit = live, digits[live, p]
+
+        # Pop, only on the rows still popping, while the top is smaller
+        while len(cand):
+            t = top[cand]
+            has = t > 0
+            cand, digit, t = cand[has], digit[has], t[has]
+            pos = stack[cand, t - 1]
+            pop = digits[cand, pos] < digit
+            cand, digit, pos = cand[pop], digit[pop], pos[pop]
+            order[cand, pos] = deleted[cand]
+            deleted[cand] += 1
+            top[cand] -= 1
+
+        stack[live, top[live]] = p
+        top[live] += 1
+
+    # The non-increasing leftovers go last, from the top of the stack down
+    r, c = np.nonzero(np.arange(stride) < top[:, None])
+    order[r, stack[r, c]] = (deleted + top - 1)[r] - c
+
+    keep = lengths[:, None] - order
+    keep[np.arange(stride) >= lengths[:, None]] = stride
+    return keep.astype(np.int32)
+
+
+def _batch_select(digits, keep, owner, ks):
+    """Row r: max_subsequence(digits[owner[r]], ks[r]), padded with -1 (NumPy)."""
+    mask = keep[owner] <= ks.astype(np.int32)[:, None]
+    out = np.full(mask.shape, -1, dtype=np.int8)
+    rows = np.repeat(np.arange(len(owner)), ks)
+    cols = np.arange(len(rows)) - np.repeat(np.cumsum(ks) - ks, ks)
+    out[rows, cols] = digits[owner][mask]
+    return out
+
+
+def _batch_merge_best(a, la, b, lb, owner, count):
+    """
+    `merge` run in lockstep over many rows, keeping the best per query (NumPy).
+
+    Rows are grouped by `owner`. After every digit, rows whose digit is
+    below the best of their query are dropped, so most splits stop after
+    a few digits. Reads past a row's end give -1, which sorts below every
+    digit and so reproduces "the longer suffix wins" on ties.
+
+    Returns:
+        (count, K) uint8 array, row q the best merge of the rows of query q.
+    """
+    rows = a.shape[0]
+    total = la + lb
+    width = int(total.max()) if rows else 0
+    stride = width + 1
+
+    # Flat copies padded to the longest merge: every read index is in range
+    flat_a = np.full((rows, stride), -1, dtype=np.int8)
+    flat_b = np.full((rows, stride), -1, dtype=np.int8)
+    flat_a[:, : min(a.shape[1], stride)] = a[:, :stride]
+    flat_b[:, : min(b.shape[1], stride)] = b[:, :stride]
+    flat_a, flat_b = flat_a.ravel(), flat_b.ravel()
+    i = np.arange(rows) * stride
+    j = i.copy()
+
+    best = np.zeros((count, width), dtype=np.uint8)
+    live = np.arange(rows)
+    for t in range(width):
+        live = live[total[live] > t]
+        if not len(live):
+            break
+        x, y = flat_a[i[live]], flat_b[j[live]]
+        take_a = x > y
+
+        # Ties: walk both suffixes until they differ or both run out
+        tied = np.flatnonzero((x == y) & (x >= 0))
+        d = 1
+        while len(tied):
+            xs = flat_a[i[live[tied]] + d]
+            ys = flat_b[j[live[tied]] + d]
+            differ = xs != ys
+            take_a[tied[differ & (xs > ys)]] = True
+            tied = tied[~differ & (xs >= 0)]
+            d += 1
+
+        digit = np.where(take_a, x, y)
+        own = owner[live]
+        starts = np.flatnonzero(np.r_[True, own[1:] != own[:-1]])
+        top = np.maximum.reduceat(digit, starts)
+        best[own[starts], t] = top
+
+        i[live] += take_a
+        j[live] += ~take_a
+        live = live[digit == np.repeat(top, np.diff(np.r_[starts, len(own)]))]
 
     return best
 
 
+def max_number_batch(queries: Sequence[Tuple[List[int], List[int], int]]):
+    """
+    Evaluate `max_number` for many (nums1, nums2, k) queries at once.
+
+    With NumPy available, each side of every query is packed once and
+    gets a single monotonic-stack pass, which yields the best subsequence
+    of every length; every (query, split) pair then becomes one merge row,
+    and the rows of each query are merged in lockstep while splits that
+    fall behind are dropped. Fewer than `NUMPY_MIN_QUERIES` queries run
+    `max_number` one by one. Without NumPy the digits are stored as
+    `array('B')` and each query runs `max_number`.
+
+    Args:
+        queries: Sequence of (nums1, nums2, k) tuples.
+
+    Returns:
+        (digits, lengths), where lengths[q] is the length of answer q and
+        digits holds the answers row by row, padded with zeros:
+          - NumPy: a (Q, K) uint8 array, answer q is digits[q, :lengths[q]].
+          - Fallback: a flat array('B') of Q * K entries, answer q is
+            digits[q * K : q * K + lengths[q]].
+    """
+    if _numpy() is None:
+        return _max_number_batch_fallback(queries)
+
+    if len(queries) < NUMPY_MIN_QUERIES:
+        digits, lengths = _max_number_batch_fallback(queries)
+        lengths = np.frombuffer(lengths, dtype=np.int64).copy()
+        width = int(lengths.max()) if len(queries) else 0
+        digits = np.frombuffer(digits, dtype=np.uint8).reshape(len(queries), width)
+        return digits.copy(), lengths
+
+    count = len(queries)
+    left, n = _pack_rows([nums1 for nums1, _, _ in queries])
+    right, m = _pack_rows([nums2 for _, nums2, _ in queries])
+    ks = np.fromiter((k for _, _, k in queries), dtype=np.int64, count=count)
+
+    # One row per (query, split): lk digits from nums1, rk from nums2
+    lo, hi = np.maximum(0, ks - m), np.minimum(ks, n)
+    splits = np.maximum(hi - lo + 1, 0)
+    owner = np.repeat(np.arange(count), splits)
+    first = np.repeat(np.cumsum(splits) - splits, splits)
+    lk = lo[owner] + np.arange(len(owner)) - first
+    rk = ks[owner] - lk
+
+    lengths = np.zeros(count, dtype=np.int64)
+    lengths[owner] = ks[owner]
+    if not len(owner):
+        return np.zeros((count, 0), dtype=np.uint8), lengths
+
+    a = _batch_select(left, _batch_keep_from(left, n), owner, lk)
+    b = _batch_select(right, _batch_keep_from(right, m), owner, rk)
+    return _batch_merge_best(a, lk, b, rk, owner, count), lengths
+
+
+def _max_number_batch_fallback(queries):
+    """Pure-Python `max_number_batch` storing digits as array('B')."""
+    results = [
+        array("B", max_number(list(nums1), list(nums2), k))
+        for nums1, nums2, k in queries
+    ]
+    lengths = array("q", (len(r) for r in results))
+    width = max(lengths, default=0)
+
+    digits = array("B", bytes(len(results) * width))
+    for q, r in enumerate(results):
+        digits[q * width : q * width + len(r)] = r
+    return digits, lengths
+
+
 # ------------------------------------------------------------
 # MAIN
 # ------------------------------------------------------------
 def main():
+    import random  # only the cross-checks need it
+
     print("Running sample test cases...\n")
 
     tests = [
@@ -175,6 +948,87 @@ def main():
 
         print("-" * 50)
 
+    # Cross-check the engines against the reference "upgrade" strategy
+    rng = random.Random(0)
+    for _ in range(200):
+        nums = [rng.randint(0, 9) for _ in range(rng.randint(0, 12))]
+        k_min = rng.randint(0, len(nums))
+        down = {k: sub[:] for k, sub in max_subsequences_all(nums, k_min=k_min)}
+        up = [(k, sub[:]) for k, sub in max_subsequences_all(nums, None, k_min, True)]
+        assert [k for k, _ in up] == list(range(k_min, len(nums) + 1)), nums
+        for k, sub in up:
+            reference = max_subsequence(nums, k, mode="upgrade")
+            assert max_subsequence(nums, k) == reference, (nums, k)
+            assert sub == reference and down[k] == reference, (nums, k)
+    print("Engine cross-check passed!")
+
+    # Cross-check the suffix ranks, and the merge on short and long runs,
+    # against slice-based suffix comparison. Repeated blocks make common
+    # prefixes longer than PEEK, which the merges settle by ranking
+    for _ in range(500):
+        block = [rng.randint(0, 3) for _ in range(rng.randint(1, 3))]
+        a = block * rng.randint(0, 6) + [rng.randint(0, 3) for _ in range(3)]
+        b = block * rng.randint(0, 6) + [rng.randint(0, 3) for _ in range(3)]
+        a, b = a[: rng.randint(0, len(a))], b[rng.randint(0, 2) :]
+        rank = _suffix_ranks(a, b)
+        for i in range(len(a)):
+            for j in range(len(b)):
+                if a[i:] != b[j:]:
+                    assert (rank[i] > rank[len(a) + 1 + j]) == (a[i:] > b[j:])
+        assert merge(a, b) == merge_reference(a, b), (a, b)
+        assert list(iter_merge(a, b)) == merge_reference(a, b), (a, b)
+    for k in (3000, 6000):
+        a = max_subsequence([rng.randint(0, 9) for _ in range(4 * k)], k)
+        b = max_subsequence([rng.randint(0, 9) for _ in range(4 * k)], k)
+        reference = merge_reference(a, b)
+        assert merge(a, b) == reference and list(iter_merge(a, b)) == reference
+    print("Merge cross-check passed!")
+
+    # The split search must agree with the plain loop, also when long ties
+    # of other digits than the largest one reach the ranking fallback
+    for _ in range(200):
+        hi = rng.choice([1, 2, 9])
+        nums1 = [rng.randint(0, hi) for _ in range(rng.randint(0, 14))]
+        nums2 = [rng.randint(0, hi) for _ in range(rng.randint(0, 14))]
+        k = rng.randint(0, len(nums1) + len(nums2))
+        reference = max_number_reference(nums1, nums2, k)
+        assert max_number(nums1, nums2, k) == reference, (nums1, nums2, k)
+    print("Split search cross-check passed!")
+
+    # The parallel split search must agree with the serial one
+    for _ in range(5):
+        nums1 = [rng.randint(0, 9) for _ in range(rng.randint(1, 40))]
+        nums2 = [rng.randint(0, 9) for _ in range(rng.randint(1, 40))]
+        k = rng.randint(1, len(nums1) + len(nums2))
+        serial = max_number(nums1, nums2, k)
+        assert max_number(nums1, nums2, k, workers=3) == serial, (nums1, nums2, k)
+    print("Parallel split search cross-check passed!")
+
+    # The batch API must agree with per-query max_number
+    queries = [(nums1, nums2, k) for nums1, nums2, k, _ in tests]
+    for _ in range(NUMPY_MIN_QUERIES):
+        nums1 = [rng.randint(0, 9) for _ in range(rng.randint(0, 8))]
+        nums2 = [rng.randint(0, 9) for _ in range(rng.randint(0, 8))]
+        queries.append((nums1, nums2, rng.randint(0, len(nums1) + len(nums2))))
+    for batch in (queries, queries[:50], []):
+        digits, lengths = max_number_batch(batch)
+        packed = _numpy() is None
+        width = len(digits) // max(len(batch), 1) if packed else digits.shape[1]
+        for q, (nums1, nums2, k) in enumerate(batch):
+            row = digits[q * width : (q + 1) * width] if packed else digits[q]
+            assert list(row[: lengths[q]]) == max_number(nums1, nums2, k), q
+    print("Batch cross-check passed!")
+
+    # The stream must match max_subsequence on every prefix
+    for _ in range(200):
+        nums = [rng.randint(0, 9) for _ in range(rng.randint(0, 30))]
+        k = rng.randint(0, 6)
+        stream = MaxSubsequenceStream(k)
+        for t, digit in enumerate(nums, 1):
+            stream.push(digit)
+            assert stream.current() == max_subsequence(nums[:t], k), (nums, k, t)
+    print("Stream cross-check passed!")
+
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,44 @@
-import unittest
+import concurrent.futures
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import accumulate, islice, repeat
+from operator import lt
+
+# NumPy is optional, and imported by `_numpy()` on first use only
+np = None
+_numpy_tried = False
 
 MOD = 10**9 + 7
 
+# Number of elements read per chunk by the out-of-core engine
+CHUNK_SIZE = 1 << 16
+
+# Combined input size from which in-memory inputs use the NumPy engine
+VECTOR_THRESHOLD = 1 << 12
+
+
+def _numpy():
+    """The NumPy module, imported on the first call; None if not installed."""
+    global np, _numpy_tried
+    if not _numpy_tried:
+        _numpy_tried = True
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover - NumPy is optional
+            pass
+    return np
+
 
-def maxsum(nums1, nums2):
+def _is_ndarray(nums):
+    """True for NumPy arrays (NumPy is loaded already if `nums` is one)."""
+    return sys.modules.get("numpy") is not None and isinstance(
+        nums, _numpy().ndarray
+    )
+
+
+def maxsum(nums1, nums2, chunk_size=CHUNK_SIZE):
     """
     Returns the maximum score achievable by traversing two sorted arrays.
     Uses a two-pointer technique to traverse both arrays, accumulating sums
@@ -11,13 +46,40 @@ def maxsum(nums1, nums2):
     accumulated sums is added to the total score. The process continues until
     both arrays are fully traversed.
 
+    Lists and tuples are walked in place; from `VECTOR_THRESHOLD` combined
+    elements (or for in-memory NumPy arrays) the work goes to `maxsum_numpy`
+    when NumPy is installed. Any other input (iterators, generators, or
+    buffer-protocol objects such as `array`, `mmap` and `np.memmap` views)
+    is handed to `maxsum_chunked`, which reads it in chunks of `chunk_size`
+    elements with constant memory.
+
     Args:
         nums1 (List[int]): First sorted array.
         nums2 (List[int]): Second sorted array.
+        chunk_size (int): Elements per chunk for non-list inputs.
 
         Returns:
             int: The maximum score achievable by traversing the two arrays
     """
+    if not _in_memory(nums1) or not _in_memory(nums2):
+        return maxsum_chunked(nums1, nums2, chunk_size)
+
+    if len(nums1) + len(nums2) >= VECTOR_THRESHOLD and _numpy() is not None:
+        result = maxsum_numpy(nums1, nums2)
+        if result is not None:
+            return result
+
+    # Indexing an ndarray yields fixed-width scalars: walk Python ints
+    if _is_ndarray(nums1):
+        nums1 = nums1.tolist()
+    if _is_ndarray(nums2):
+        nums2 = nums2.tolist()
+
+    return _maxsum_walk(nums1, nums2)
+
+
+def _maxsum_walk(nums1, nums2):
+    """The pure-Python two-pointer walk of `maxsum` over two sequences."""
     i = j = 0
     n, m = len(nums1), len(nums2)
     sum1 = sum2 = total = 0
@@ -73,49 +135,610 @@ def maxsum(nums1, nums2):
     return total % MOD
 
 
-class TestMaxSum(unittest.TestCase):
-    """Unit tests for the maxsum function."""
+def _in_memory(nums):
+    """True for inputs walked by index: lists, tuples and non-mapped ndarrays."""
+    if isinstance(nums, (list, tuple)):
+        return True
+    return _is_ndarray(nums) and not isinstance(nums, np.memmap) and nums.ndim == 1
+
+
+def maxsum_numpy(nums1, nums2):
+    """
+    Vectorized `maxsum` using segment reduction (requires NumPy).
+
+    Shared values split both arrays into aligned segments:
+        1. `intersect1d` finds the shared values and `searchsorted` their
+           positions in each array.
+        2. Prefix sums give every segment sum (shared value included) in
+           O(1) per segment.
+        3. The answer is the sum of the elementwise max of the segment sums,
+           plus the larger of the two tails.
+
+    Sums are computed in int64 only when they provably cannot overflow,
+    and shared values are matched this way only when both arrays are
+    strictly increasing (the walk pairs repeated values in order); otherwise
+    None is returned and the caller falls back to the exact Python walk.
+
+    Args:
+        nums1 (List[int]): First sorted array.
+        nums2 (List[int]): Second sorted array.
+
+    Returns:
+        Optional[int]: The maximum score modulo MOD, or None if the input
+        does not fit int64 arithmetic, repeats a value, or NumPy is not
+        installed.
+    """
+    if _numpy() is None:
+        return None
+    try:
+        a = np.asarray(nums1, dtype=np.int64)
+        b = np.asarray(nums2, dtype=np.int64)
+    except (OverflowError, TypeError, ValueError):
+        return None
+
+    # Every partial sum is bounded by the sum of absolute values. Python
+    # ints: np.abs(INT64_MIN) wraps around to itself
+    bound = sum(
+        max(abs(int(x.min())), abs(int(x.max()))) * len(x) for x in (a, b) if len(x)
+    )
+    if bound >= 2**63:
+        return None
+    if not (_strictly_increasing(a) and _strictly_increasing(b)):
+        return None
+
+    common = np.intersect1d(a, b, assume_unique=True)
+    ends_a = np.searchsorted(a, common) + 1
+    ends_b = np.searchsorted(b, common) + 1
+
+    prefix_a = np.concatenate(([0], np.cumsum(a)))
+    prefix_b = np.concatenate(([0], np.cumsum(b)))
+
+    starts_a = np.concatenate(([0], ends_a[:-1]))
+    starts_b = np.concatenate(([0], ends_b[:-1]))
+
+    seg_a = prefix_a[ends_a] - prefix_a[starts_a]
+    seg_b = prefix_b[ends_b] - prefix_b[starts_b]
+
+    last_a = int(ends_a[-1]) if len(common) else 0
+    last_b = int(ends_b[-1]) if len(common) else 0
+    tail_a = int(prefix_a[-1] - prefix_a[last_a])
+    tail_b = int(prefix_b[-1] - prefix_b[last_b])
+
+    total = int(np.maximum(seg_a, seg_b).sum()) + max(tail_a, tail_b)
+    return total % MOD
+
+
+def _strictly_increasing(nums):
+    """True if every value of `nums` is larger than the one before it."""
+    if _is_ndarray(nums):
+        return bool(np.all(nums[1:] > nums[:-1]))
+    return all(map(lt, nums, islice(nums, 1, None)))
+
+
+def _iter_chunks(source, chunk_size):
+    """
+    Yield non-empty chunks of `source` with at most `chunk_size` elements.
+
+    Buffer-protocol objects are sliced through a memoryview (zero-copy);
+    raw byte buffers such as `mmap` are read as native int64. Anything else
+    is consumed as an iterator.
+    """
+    try:
+        view = memoryview(source)
+    except TypeError:
+        it = iter(source)
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    else:
+        if view.itemsize == 1 and view.format in ("B", "b", "c"):
+            view = view.cast("B").cast("q")
+        elif view.ndim != 1:
+            view = view.cast("B").cast(view.format)
+        for start in range(0, len(view), chunk_size):
+            yield view[start : start + chunk_size]
+
+
+def maxsum_chunked(nums1, nums2, chunk_size=CHUNK_SIZE):
+    """
+    Out-of-core variant of `maxsum` over iterators or buffer-protocol inputs.
+
+    Runs the same two-pointer walk, but over one chunk of each input at a
+    time: when a chunk is exhausted the next one is loaded and the pointer
+    restarts at 0, while `sum1`, `sum2` and `total` carry across the chunk
+    boundary. Memory use is bounded by two chunks.
+
+    Args:
+        nums1: First sorted input (iterable or buffer of int64).
+        nums2: Second sorted input (iterable or buffer of int64).
+        chunk_size (int): Elements read per chunk.
+
+    Returns:
+        int: Same result as `maxsum` on the materialized lists.
+    """
+    chunks1 = _iter_chunks(nums1, chunk_size)
+    chunks2 = _iter_chunks(nums2, chunk_size)
+    a = next(chunks1, None)
+    b = next(chunks2, None)
+    i = j = 0
+    sum1 = sum2 = total = 0
+
+    while a is not None and b is not None:
+        n, m = len(a), len(b)
+
+        while i < n and j < m:
+            x, y = a[i], b[j]
+            if x < y:
+                sum1 += x
+                i += 1
+            elif y < x:
+                sum2 += y
+                j += 1
+            else:
+                # shared point: close the segment
+                total += max(sum1 + x, sum2 + x)
+                sum1 = sum2 = 0
+                i += 1
+                j += 1
+
+        # Refill whichever chunk ran out
+        if i == n:
+            a, i = next(chunks1, None), 0
+        if j == m:
+            b, j = next(chunks2, None), 0
+
+    # One input is exhausted: the rest of the other is a single tail
+    while a is not None:
+        sum1 += sum(a[i:])
+        a, i = next(chunks1, None), 0
+    while b is not None:
+        sum2 += sum(b[j:])
+        b, j = next(chunks2, None), 0
+
+    total += max(sum1, sum2)
+    return total % MOD
+
+
+def _find_cuts(nums1, nums2, parts):
+    """
+    Pick up to `parts - 1` shared values splitting both arrays evenly.
+    Both arrays must be strictly increasing.
+
+    For each evenly spaced pivot in nums1, scan forward to the first value
+    also in nums2 before the next pivot (see `_first_shared`).
+
+    Returns:
+        List of (i, j) index pairs with nums1[i] == nums2[j], increasing.
+    """
+    n = len(nums1)
+    cuts = []
+    j_lo = 0
+
+    for t in range(1, parts):
+        i, stop = n * t // parts, n * (t + 1) // parts
+        if cuts and i <= cuts[-1][0]:
+            i = cuts[-1][0] + 1
+
+        cut = _first_shared(nums1, nums2, i, stop, j_lo)
+        if cut is not None:
+            cuts.append(cut)
+            j_lo = cut[1] + 1
+
+    return cuts
+
+
+# Elements of nums1 searched by the first `searchsorted` of a pivot window
+CUT_BLOCK = 1 << 10
+
+
+def _first_shared(nums1, nums2, i, stop, j_lo):
+    """
+    First (i, j) with i in [i, stop), j >= j_lo and nums1[i] == nums2[j].
+
+    NumPy arrays are searched in blocks of doubling size, one
+    `searchsorted` per block; other sequences value by value with
+    `bisect_left`. Returns None if the window holds no shared value.
+    """
+    m = len(nums2)
+    if not _is_ndarray(nums1):
+        while i < stop:
+            j = bisect_left(nums2, nums1[i], j_lo, m)
+            if j < m and nums2[j] == nums1[i]:
+                return i, j
+            i += 1
+        return None
+
+    rest = nums2[j_lo:]
+    block = CUT_BLOCK
+    while i < stop and len(rest):
+        window = nums1[i : min(i + block, stop)]
+        pos = np.searchsorted(rest, window)
+        hits = np.flatnonzero(rest[np.minimum(pos, len(rest) - 1)] == window)
+        if len(hits):
+            h = int(hits[0])
+            return i + h, j_lo + int(pos[h])
+        i += len(window)
+        block *= 2
+    return None
+
+
+def _score_shared_chunk(name1, len1, name2, len2, i_lo, i_hi, j_lo, j_hi):
+    """Worker: score nums1[i_lo:i_hi] and nums2[j_lo:j_hi] from shared memory."""
+    from multiprocessing import shared_memory
+
+    shm1 = shared_memory.SharedMemory(name=name1)
+    shm2 = shared_memory.SharedMemory(name=name2)
+    view1 = shm1.buf.cast("q")
+    view2 = shm2.buf.cast("q")
+    try:
+        part1, part2 = view1[:len1][i_lo:i_hi], view2[:len2][j_lo:j_hi]
+        score = None
+        if _numpy() is not None:
+            # Zero-copy arrays over the shared block, freed before the release
+            score = maxsum_numpy(
+                np.frombuffer(part1, dtype=np.int64),
+                np.frombuffer(part2, dtype=np.int64),
+            )
+        if score is None:
+            score = maxsum_chunked(part1, part2)
+        part1.release()
+        part2.release()
+        return score
+    finally:
+        view1.release()
+        view2.release()
+        shm1.close()
+        shm2.close()
+
+
+def _to_shared(data):
+    """Copy an array('q') into a new shared-memory int64 block."""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1) * 8)
+    shm.buf[: len(data) * 8] = memoryview(data).cast("B")
+    return shm
+
+
+def maxsum_parallel(nums1, nums2, workers=4):
+    """
+    Parallel `maxsum` splitting both arrays at shared values.
+
+    Every shared value closes a segment (`sum1`/`sum2` reset there), so
+    cutting both arrays right after the same shared value yields independent
+    chunks whose scores simply add up. Cuts are chosen near evenly spaced
+    positions of nums1 by searching nums2 (see `_find_cuts`). The inputs are
+    copied once into shared memory; workers slice them by index instead of
+    receiving pickled lists, and score their chunk with `maxsum_numpy` when
+    NumPy is installed. Since (x + y) % MOD == (x % MOD + y % MOD) % MOD,
+    the per-chunk results combine exactly. Cuts need strictly increasing
+    arrays: inputs that repeat a value are scored by `maxsum` instead.
+
+    Args:
+        nums1 (List[int]): First sorted array.
+        nums2 (List[int]): Second sorted array.
+        workers (int): Number of worker processes.
+
+    Returns:
+        int: Same result as `maxsum`.
+
+    Raises:
+        OverflowError: If a value does not fit int64; nothing is shared then.
+    """
+    if workers <= 1:
+        return maxsum(nums1, nums2)
+
+    data1, data2 = array("q", nums1), array("q", nums2)
+    if _numpy() is not None:
+        view1 = np.frombuffer(data1, dtype=np.int64)
+        view2 = np.frombuffer(data2, dtype=np.int64)
+    else:
+        view1, view2 = data1, data2
+    if not (_strictly_increasing(view1) and _strictly_increasing(view2)):
+        return maxsum(nums1, nums2)
+
+    cuts = _find_cuts(view1, view2, workers)
+    if not cuts:
+        return maxsum(nums1, nums2)
+
+    bounds = [(0, 0)] + [(i + 1, j + 1) for i, j in cuts]
+    bounds.append((len(data1), len(data2)))
+
+    shm1 = shm2 = None
+    try:
+        shm1 = _to_shared(data1)
+        shm2 = _to_shared(data2)
+        executor = concurrent.futures.ProcessPoolExecutor
+        with executor(max_workers=min(workers, len(bounds) - 1)) as pool:
+            futures = [
+                pool.submit(
+                    _score_shared_chunk,
+                    shm1.name,
+                    len(data1),
+                    shm2.name,
+                    len(data2),
+                    i_lo,
+                    i_hi,
+                    j_lo,
+                    j_hi,
+                )
+                for (i_lo, j_lo), (i_hi, j_hi) in zip(bounds, bounds[1:])
+            ]
+            return sum(f.result() for f in futures) % MOD
+    finally:
+        for shm in (shm1, shm2):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+
+def maxsum_multi(arrays):
+    """
+    Maximum score over k sorted arrays, generalizing `maxsum`.
+
+    A value present in several arrays is a junction between exactly those
+    arrays: the path may switch among them there, and the value is counted
+    once. All arrays are walked together with a heap-based k-way merge;
+    `best[a]` holds the best score of a path currently in array `a`. For each
+    distinct value v found in arrays S:
+
+        best[a] = max(best[s] + v for s in S)   for every a in S
+
+    which solves the junction DAG in a single pass. With two arrays this is
+    exactly the two-pointer walk of `maxsum`.
+
+    Args:
+        arrays (List[Iterable[int]]): Strictly increasing inputs.
+
+    Returns:
+        int: The maximum score modulo MOD. Time O(N log k) for N elements.
+    """
+    best = [0] * len(arrays)
+    streams = [zip(arr, repeat(a)) for a, arr in enumerate(arrays)]
+
+    group = []
+    current = None
+
+    for value, a in merge(*streams):
+        if group and value != current:
+            _close_junction(best, group, current)
+            group = []
+        current = value
+        group.append(a)
+
+    if group:
+        _close_junction(best, group, current)
+
+    return max(best, default=0) % MOD
+
 
-    def test_basic(self):
-        """Basic test case from the prompt."""
-        self.assertEqual(maxsum([1, 3, 5, 7, 9], [1, 2, 3, 4, 5]), 31)
+def _close_junction(best, group, value):
+    """Add `value` to every array in `group` and let them share the best score."""
+    score = max(best[a] for a in group) + value
+    for a in group:
+        best[a] = score
 
-    def test_no_shared(self):
-        """With no shared elements, you just pick the array with the largest sum"""
-        a = [1, 2, 3]
-        b = [4, 5, 6]
-        expected = max(sum(a), sum(b)) % MOD
-        self.assertEqual(maxsum(a, b), expected)
 
-    def test_all_shared(self):
-        """All elements shared -> you effectively traverse a single set of uniques"""
-        a = [1, 2, 3]
-        b = [1, 2, 3]
-        expected = sum(a) % MOD
-        self.assertEqual(maxsum(a, b), expected)
+class _SortedBlocks:
+    """
+    Sorted set of ints with prefix sums, stored as a list of sorted blocks.
+
+    Every block holds at most `2 * LOAD` values, and a Fenwick tree over
+    the block sums gives the sum of all blocks before any block. An insert
+    or delete shifts O(LOAD) items of one block (in C) and updates the tree
+    in O(log n) steps; splitting or dropping a block rebuilds the tree in
+    O(n / LOAD), once every O(LOAD) updates. Building from n values is a
+    sort.
+    """
+
+    LOAD = 64
+
+    def __init__(self, values=()) -> None:
+        values = sorted(values)
+        self._blocks = [
+            values[i : i + self.LOAD] for i in range(0, len(values), self.LOAD)
+        ]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._rebuild()
+
+    def _rebuild(self):
+        """Fenwick tree over the block sums (1-based, O(blocks))."""
+        tree = [0] + [sum(block) for block in self._blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _add_to_block(self, b, delta):
+        i = b + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _before(self, b):
+        """Sum of the blocks before block b."""
+        total = 0
+        while b > 0:
+            total += self._tree[b]
+            b -= b & -b
+        return total
+
+    def add(self, value):
+        b = bisect_left(self._maxes, value)
+        if b == len(self._blocks):
+            if not self._blocks:
+                self._blocks.append([value])
+                self._maxes.append(value)
+                self._rebuild()
+                return
+            b -= 1
+            self._maxes[b] = value
+
+        block = self._blocks[b]
+        block.insert(bisect_left(block, value), value)
 
-    def test_shared_in_middle(self):
-        """Shared elements in the middle of the arrays"""
-        a = [2, 4, 6, 8]
-        b = [1, 6, 7, 9]
-        expected = (max(2 + 4 + 6, 1 + 6) + max(8, 7 + 9)) % MOD  # 28
-        self.assertEqual(maxsum(a, b), expected)
+        if len(block) <= 2 * self.LOAD:
+            self._add_to_block(b, value)
+            return
 
-    def test_single_element(self):
-        """Single shared element => counted once"""
-        self.assertEqual(maxsum([5], [5]), 5)
+        # Split an oversized block in two halves
+        self._blocks.insert(b + 1, block[self.LOAD :])
+        del block[self.LOAD :]
+        self._maxes[b] = block[-1]
+        self._maxes.insert(b + 1, self._blocks[b + 1][-1])
+        self._rebuild()
 
-    def test_large_values(self):
-        """Large value, ensure modulo is applied correctly"""
-        x = 10**9
-        expected = x % MOD
-        self.assertEqual(maxsum([x], [x]), expected)
+    def remove(self, value):
+        b = bisect_left(self._maxes, value)
+        block = self._blocks[b]
+        del block[bisect_left(block, value)]
+
+        if block:
+            self._maxes[b] = block[-1]
+            self._add_to_block(b, -value)
+        else:
+            del self._blocks[b], self._maxes[b]
+            self._rebuild()
+
+    def prefix(self, value):
+        """Sum of the values <= value."""
+        b = bisect_left(self._maxes, value)
+        total = self._before(b)
+        if b < len(self._blocks):
+            block = self._blocks[b]
+            total += sum(block[: bisect_right(block, value)])
+        return total
+
+    def total(self):
+        return self._before(len(self._blocks))
+
+    def below(self, value):
+        """Largest value < value, or None."""
+        b = bisect_left(self._maxes, value)
+        if b < len(self._blocks):
+            block = self._blocks[b]
+            k = bisect_left(block, value)
+            if k:
+                return block[k - 1]
+        return self._maxes[b - 1] if b else None
+
+    def above(self, value):
+        """Smallest value > value, or None."""
+        b = bisect_right(self._maxes, value)
+        if b == len(self._blocks):
+            return None
+        block = self._blocks[b]
+        return block[bisect_right(block, value)]
+
+
+class MaxScoreIndex:
+    """
+    Maximum score of two sorted sets supporting inserts and deletes.
 
-    def test_one_empty(self):
-        """If one array is empty, you must take the other completely"""
-        self.assertEqual(maxsum([], [1, 2, 3]), sum([1, 2, 3]) % MOD)
-        self.assertEqual(maxsum([1, 2, 3], []), sum([1, 2, 3]) % MOD)
+    The score is the sum, over the segments delimited by shared values, of
+    max(segment sum in nums1, segment sum in nums2) -- the same quantity the
+    two-pointer `maxsum` accumulates, with the tail as the last segment.
+    Values of each side live in a sorted block list carrying block sums, so
+    any segment sum is a range query; shared values live in another one, so
+    the neighbouring shared values of any point are found by binary search.
+
+    An update only touches the segment(s) between the shared values around
+    the changed value: their contribution is subtracted, the value is
+    inserted or removed, and the contribution is added back. Updates take
+    O(log n + LOAD) steps, the LOAD part in C, amortized (see
+    `_SortedBlocks`); `score()` is O(1). Values are plain Python ints of
+    any size, as in `maxsum`.
+
+    Example:
+        index = MaxScoreIndex([1, 3, 5, 7, 9], [1, 2, 3, 4, 5])
+        index.score()        # 31
+        index.insert(1, 20)  # nums2 gains 20: its tail now beats 7 + 9
+        index.score()        # 35
+    """
+
+    def __init__(self, nums1=(), nums2=()) -> None:
+        self._values = (set(), set())
+        for side, nums in enumerate((nums1, nums2)):
+            for value in nums:
+                if value in self._values[side]:
+                    raise ValueError(f"duplicate value {value!r} in nums{side + 1}")
+                self._values[side].add(value)
+
+        ordered = [sorted(values) for values in self._values]
+        shared = sorted(self._values[0] & self._values[1])
+        self._sums = tuple(_SortedBlocks(values) for values in ordered)
+        self._shared = _SortedBlocks(shared)
+
+        # Segment sums of each side between consecutive shared values
+        segments = []
+        for values in ordered:
+            prefix = list(accumulate(values, initial=0))
+            ends = [bisect_right(values, value) for value in shared]
+            ends.append(len(values))
+            segments.append([prefix[e] - prefix[s] for s, e in zip([0] + ends, ends)])
+        self._total = sum(map(max, *segments))
+
+    def score(self) -> int:
+        """Current maximum score modulo MOD."""
+        return self._total % MOD
+
+    def insert(self, side: int, value: int) -> None:
+        """Insert `value` into nums1 (side 0) or nums2 (side 1)."""
+        if value in self._values[side]:
+            raise ValueError(f"{value!r} is already in nums{side + 1}")
+        self._update(side, value, +1)
+
+    def delete(self, side: int, value: int) -> None:
+        """Delete `value` from nums1 (side 0) or nums2 (side 1)."""
+        if value not in self._values[side]:
+            raise ValueError(f"{value!r} is not in nums{side + 1}")
+        self._update(side, value, -1)
+
+    def _update(self, side, value, sign):
+        lo, hi = self._shared.below(value), self._shared.above(value)
+        self._total -= self._region(lo, value, hi)
+
+        if sign > 0:
+            self._values[side].add(value)
+            self._sums[side].add(value)
+        else:
+            self._values[side].discard(value)
+            self._sums[side].remove(value)
+
+        # The value is shared iff it is (now / was) present on the other side
+        if value in self._values[1 - side]:
+            if sign > 0:
+                self._shared.add(value)
+            else:
+                self._shared.remove(value)
+
+        self._total += self._region(lo, value, hi)
+
+    def _region(self, lo, value, hi):
+        """Score of the segments between shared values lo and hi."""
+        if value in self._values[0] and value in self._values[1]:
+            return self._segment(lo, value) + self._segment(value, hi)
+        return self._segment(lo, hi)
+
+    def _segment(self, lo, hi):
+        """max of both sides' sums over values in (lo, hi]; None is unbounded."""
+        return max(self._range(side, lo, hi) for side in (0, 1))
+
+    def _range(self, side, lo, hi):
+        sums = self._sums[side]
+        upper = sums.total() if hi is None else sums.prefix(hi)
+        lower = 0 if lo is None else sums.prefix(lo)
+        return upper - lower
 
 
 if __name__ == "__main__":
-    unittest.main()
+    import sys
+    import unittest
+    from pathlib import Path
+
+    # The tests live in two-pointers/tests, out of this module's import path
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    unittest.main(module="tests.test_get_maximum_score")
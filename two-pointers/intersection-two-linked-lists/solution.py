@@ -1,10 +1,18 @@
-import unittest
-from typing import Iterable, Optional
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Index used by NodePool for "no node" (the None of the object API)
+NIL = -1
 
 
 class ListNode:
     """A singly linked list node."""
 
+    __slots__ = ("val", "next")
+
     def __init__(self, val: int = 0, next_node: Optional["ListNode"] = None) -> None:
         self.val = val
         self.next = next_node
@@ -89,67 +97,336 @@ def get_intersection_node(
     return ptr_a
 
 
+def get_common_intersection(
+    heads: Sequence[Optional[ListNode]], subset: Optional[Iterable[int]] = None
+) -> Optional[ListNode]:
+    """
+    Find the first node shared by all the given linked lists.
+
+    Instead of chaining N - 1 pairwise calls, this uses:
+    - One pass over each list to measure its length and find its tail.
+      Lists that do not all end in the same tail cannot share a node.
+    - One aligned advance: every pointer first skips its extra length, then
+      all pointers step together until they coincide.
+
+    Args:
+        heads: Heads of the linked lists.
+        subset: Optional indices into `heads`; only those lists are used.
+
+    Returns:
+        The first common ListNode, or None if the lists share no node.
+        Total cost is O(total length).
+    """
+    if subset is not None:
+        heads = [heads[i] for i in subset]
+    if not heads or any(head is None for head in heads):
+        return None
+
+    # 1) Measure every list and check that they all end in the same tail
+    lengths = []
+    tail = None
+    for head in heads:
+        length, cur = 1, head
+        while cur.next is not None:
+            cur = cur.next
+            length += 1
+        if tail is None:
+            tail = cur
+        elif cur is not tail:
+            return None
+        lengths.append(length)
+
+    # 2) Align all pointers at the same distance from the common tail
+    shortest = min(lengths)
+    ptrs = []
+    for head, length in zip(heads, lengths):
+        for _ in range(length - shortest):
+            head = head.next
+        ptrs.append(head)
+
+    # 3) Advance together until every pointer is on the same node
+    first = ptrs[0]
+    while any(ptr is not first for ptr in ptrs):
+        ptrs = [ptr.next for ptr in ptrs]
+        first = ptrs[0]
+
+    return first
+
+
 # -----------------------------------------------------------
-# Unit Tests
+# Compact array-backed node storage
 # -----------------------------------------------------------
-class TestIntersectionNode(unittest.TestCase):
-    """Unit tests for get_intersection_node function."""
+class NodePool:
+    """
+    Struct-of-arrays storage for many singly linked list nodes.
 
-    def test_intersection_middle(self) -> None:
-        """
-        A: 1 -> 2 -> [8 -> 9]
-        B:       3 -> 4 ↗
+    Node `i` is represented by its index: its value is `vals[i]` and its
+    successor is `nexts[i]` (NIL for the end of a list). Both arrays are
+    typed int64 `array`s, so a node costs 16 bytes instead of a Python
+    object.
+    """
+
+    def __init__(self) -> None:
+        self.vals = array("q")
+        self.nexts = array("q")
+
+    def __len__(self) -> int:
+        return len(self.vals)
+
+    def add(self, val: int, next_node: int = NIL) -> int:
+        """Append a single node and return its index."""
+        self.vals.append(val)
+        self.nexts.append(next_node)
+        return len(self.vals) - 1
+
+    def build_list(self, values: Iterable[int], next_node: int = NIL) -> int:
         """
-        common = build_list([8, 9])
-        head_a = build_list([1, 2])
-        head_b = build_list([3, 4])
+        Append a linked list holding `values` and return its head index.
 
-        # Attach A tail → common
-        cur = head_a
-        while cur.next:
-            cur = cur.next
-        cur.next = common
+        Args:
+            values: Values of the new nodes.
+            next_node: Node the new tail points to. Passing an existing node
+                builds a shared suffix directly, without the tail walk of
+                `connect_lists_at_node`.
 
-        # Attach B tail → common
+        Returns:
+            The head index, or `next_node` if `values` is empty.
+        """
+        start = len(self.vals)
+        self.vals.extend(values)
+        end = len(self.vals)
+        if end == start:
+            return next_node
+
+        # Each new node points to the next one; the last one to next_node
+        self.nexts.extend(range(start + 1, end + 1))
+        self.nexts[end - 1] = next_node
+        return start
+
+    def connect_lists_at_node(self, head_b: int, node: int) -> None:
+        """Connect the tail of list B to `node` (see `connect_lists_at_node`)."""
+        if head_b == NIL:
+            return
+
+        nexts = self.nexts
         cur = head_b
-        while cur.next:
-            cur = cur.next
-        cur.next = common
+        while nexts[cur] != NIL:
+            cur = nexts[cur]
+        nexts[cur] = node
+
+
+# On-disk layout: header, then vals[count] and nexts[count] as int64
+POOL_MAGIC = b"NODEPOOL"
+POOL_HEADER = struct.Struct("<8sQ")
+
+
+def save_pool(pool: NodePool, path: str) -> None:
+    """
+    Write a NodePool to `path` in the binary format read by `MappedNodePool`.
+
+    Layout (little-endian):
+        header : 8-byte magic b"NODEPOOL", uint64 node count
+        vals   : int64[count]
+        nexts  : int64[count]
+    """
+    vals, nexts = pool.vals, pool.nexts
+    if sys.byteorder != "little":
+        vals, nexts = array("q", vals), array("q", nexts)
+        vals.byteswap()
+        nexts.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(POOL_HEADER.pack(POOL_MAGIC, len(vals)))
+        vals.tofile(f)
+        nexts.tofile(f)
+
+
+class MappedNodePool:
+    """
+    Read-only NodePool view over a file written by `save_pool`.
+
+    The file is memory-mapped and `vals` / `nexts` are int64 memoryviews
+    into the mapping, so opening is O(1) regardless of the node count and
+    pages are only read when touched. Works anywhere a NodePool is
+    expected for reading, e.g. `get_intersection_index`.
 
-        self.assertIs(get_intersection_node(head_a, head_b), common)
+    Example:
+        with MappedNodePool("graph.bin") as pool:
+            get_intersection_index(pool, head_a, head_b)
+    """
+
+    def __init__(self, path: str) -> None:
+        if sys.byteorder != "little":
+            raise ValueError("MappedNodePool requires a little-endian host")
+
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count = POOL_HEADER.unpack_from(self._mmap)
+        if magic != POOL_MAGIC or len(self._mmap) != POOL_HEADER.size + 16 * count:
+            self._mmap.close()
+            raise ValueError(f"{path!r} is not a NodePool file")
+
+        self._view = memoryview(self._mmap)
+        start, mid = POOL_HEADER.size, POOL_HEADER.size + 8 * count
+        self.vals = self._view[start:mid].cast("q")
+        self.nexts = self._view[mid:].cast("q")
+
+    def __len__(self) -> int:
+        return len(self.vals)
+
+    def close(self) -> None:
+        """Release the views and unmap the file."""
+        self.vals.release()
+        self.nexts.release()
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedNodePool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
-    def test_no_intersection(self) -> None:
-        """Lists do not intersect."""
-        head_a = build_list([1, 2, 3])
-        head_b = build_list([4, 5])
-        self.assertIsNone(get_intersection_node(head_a, head_b))
 
-    def test_intersection_at_head(self) -> None:
-        """A and B share the exact same head node."""
-        common = build_list([1, 2, 3])
-        head_a = head_b = common
-        self.assertIs(get_intersection_node(head_a, head_b), common)
+def get_intersection_index(pool: NodePool, head_a: int, head_b: int) -> int:
+    """
+    Pointer-switching intersection on NodePool indices.
+
+    Same algorithm as `get_intersection_node`, with NIL in place of None.
 
-    def test_one_empty_list(self) -> None:
-        """One list is empty, the other is not."""
-        head_a = None
-        head_b = build_list([1, 2, 3])
-        self.assertIsNone(get_intersection_node(head_a, head_b))
+    Args:
+        pool: The pool holding both lists.
+        head_a: Head index of the first list.
+        head_b: Head index of the second list.
 
-    def test_both_empty(self) -> None:
-        """Both lists are empty."""
-        self.assertIsNone(get_intersection_node(None, None))
+    Returns:
+        The index of the intersection node, or NIL if there is none.
+    """
+    nexts = pool.nexts
+    ptr_a, ptr_b = head_a, head_b
+
+    while ptr_a != ptr_b:
+        ptr_a = head_b if ptr_a == NIL else nexts[ptr_a]
+        ptr_b = head_a if ptr_b == NIL else nexts[ptr_b]
+
+    return ptr_a
 
-    def test_different_lengths_no_intersection(self) -> None:
+
+# -----------------------------------------------------------
+# Batch queries over a forest of merging lists
+# -----------------------------------------------------------
+class IntersectionIndex:
+    """
+    Answers many intersection queries over lists that merge toward common
+    tails.
+
+    Following `next` pointers turns the lists into a forest rooted at the
+    tails (the reversed, tail-rooted tree); the intersection of two lists is
+    the lowest common ancestor of their heads. Each node stores its parent
+    (`next`), depth, root, and one jump pointer (Myers' skew-binary jump
+    pointers), which gives O(log n) LCA queries with O(n) memory and lets
+    new heads be added incrementally.
+
+    Example:
+        index = IntersectionIndex([head_a, head_b, head_c])
+        index.intersect_many([(head_a, head_b), (head_b, head_c)])
+    """
+
+    def __init__(self, heads: Iterable[Optional[ListNode]] = ()) -> None:
+        self._ids: Dict[ListNode, int] = {}
+        self._nodes: List[ListNode] = []
+        self._parent = array("q")
+        self._jump = array("q")
+        self._depth = array("q")
+        self._root = array("q")
+
+        for head in heads:
+            self.add(head)
+
+    def add(self, head: Optional[ListNode]) -> None:
+        """Index every node reachable from `head` that is not indexed yet."""
+        ids = self._ids
+
+        # Collect the new prefix of this list, up to an indexed node or None
+        path = []
+        cur = head
+        while cur is not None and cur not in ids:
+            path.append(cur)
+            cur = cur.next
+
+        # Insert tail side first, so each parent is indexed before its child
+        parent = NIL if cur is None else ids[cur]
+        for node in reversed(path):
+            parent = self._append(node, parent)
+
+    def _append(self, node: ListNode, parent: int) -> int:
+        v = len(self._nodes)
+        self._ids[node] = v
+        self._nodes.append(node)
+        self._parent.append(parent)
+
+        if parent == NIL:
+            self._jump.append(v)
+            self._depth.append(0)
+            self._root.append(v)
+            return v
+
+        depth, jump = self._depth, self._jump
+        p, jp = parent, jump[parent]
+        if depth[p] - depth[jp] == depth[jp] - depth[jump[jp]]:
+            jump.append(jump[jp])
+        else:
+            jump.append(p)
+        depth.append(depth[p] + 1)
+        self._root.append(self._root[p])
+        return v
+
+    def intersect(
+        self, head_a: Optional[ListNode], head_b: Optional[ListNode]
+    ) -> Optional[ListNode]:
         """
-        A: 1 → 2 → 3 → 4 → 5
-        B: 9 → 8
-        No intersection. Algorithm should terminate normally.
+        Same result as `get_intersection_node(head_a, head_b)`, in O(log n).
+
+        Raises:
+            KeyError: If a head was never added to the index.
         """
-        head_a = build_list([1, 2, 3, 4, 5])
-        head_b = build_list([9, 8])
-        self.assertIsNone(get_intersection_node(head_a, head_b))
+        if head_a is None or head_b is None:
+            return None
+
+        u, v = self._ids[head_a], self._ids[head_b]
+        if self._root[u] != self._root[v]:
+            return None
+
+        parent, jump, depth = self._parent, self._jump, self._depth
+
+        # Lift the deeper node to the depth of the other
+        if depth[u] < depth[v]:
+            u, v = v, u
+        target = depth[v]
+        while depth[u] > target:
+            u = jump[u] if depth[jump[u]] >= target else parent[u]
+
+        # Climb together; jumps are taken only while they stay below the LCA
+        while u != v:
+            if jump[u] != jump[v]:
+                u, v = jump[u], jump[v]
+            else:
+                u, v = parent[u], parent[v]
+
+        return self._nodes[u]
+
+    def intersect_many(
+        self, pairs: Iterable[Tuple[Optional[ListNode], Optional[ListNode]]]
+    ) -> List[Optional[ListNode]]:
+        """Answer `intersect` for every (head_a, head_b) pair."""
+        return [self.intersect(head_a, head_b) for head_a, head_b in pairs]
 
 
 if __name__ == "__main__":
-    unittest.main()
+    import unittest
+    from pathlib import Path
+
+    # The tests live in two-pointers/tests, out of this module's import path
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    unittest.main(module="tests.test_intersection_two_linked_lists")
@@ -1,7 +1,26 @@
 """Next Palindrome with Same Digits Problem Solution."""
 
-from typing import List
-import unittest
+import re
+from bisect import bisect_right
+from collections import OrderedDict
+from math import factorial
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# NumPy is optional, and imported by `_numpy()` on first use only
+np = None
+_numpy_tried = False
+
+
+def _numpy():
+    """The NumPy module, imported on the first call; None if not installed."""
+    global np, _numpy_tried
+    if not _numpy_tried:
+        _numpy_tried = True
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover - NumPy is optional
+            pass
+    return np
 
 
 def next_permutation(digits: List[int]) -> bool:
@@ -13,17 +32,30 @@ def next_permutation(digits: List[int]) -> bool:
         True if a next permutation exists (and `digits` was modified),
         False if it's already the highest permutation.
     """
+    return _next_permutation_prefix(digits, len(digits)) >= 0
+
+
+def _next_permutation_prefix(digits, end: int) -> int:
+    """
+    Advance digits[:end] to its next lexicographical permutation in-place.
+
+    Works on any mutable sequence of comparable items (list, bytearray).
+
+    Returns:
+        The pivot index `i`: only digits[i:end] changed. -1 if digits[:end]
+        is already the highest permutation (and was left untouched).
+    """
     # Find the rightmost index 'i' where digits[i] < digits[i + 1]
-    i = len(digits) - 2
+    i = end - 2
     while i >= 0 and digits[i] >= digits[i + 1]:
         i -= 1
 
     # No such index → digits are in non-increasing order, no next permutation
     if i < 0:
-        return False
+        return -1
 
     # Find the rightmost element greater than digits[i]
-    j = len(digits) - 1
+    j = end - 1
     while digits[j] <= digits[i]:
         j -= 1
 
@@ -31,9 +63,69 @@ def next_permutation(digits: List[int]) -> bool:
     digits[i], digits[j] = digits[j], digits[i]
 
     # Reverse the suffix to get the smallest suffix after position i
-    digits[i + 1 :] = digits[i + 1 :][::-1]
+    digits[i + 1 : end] = digits[i + 1 : end][::-1]
+
+    return i
+
+
+# Longest non-decreasing run of ASCII digits, matched in C
+_NON_DECREASING = re.compile(rb"0*1*2*3*4*5*6*7*8*9*")
+
+# Whole buffer of ASCII digits (fullmatch reads any buffer without a copy)
+_DIGITS = re.compile(rb"[0-9]*")
+
+
+def find_next_palindrome_bytes(data: Union[bytes, bytearray, memoryview]) -> bytes:
+    """
+    Byte-level `find_next_palindrome` for ASCII digit buffers.
+
+    Works on bytes, bytearray or memoryview input without converting digits
+    to ints. The output buffer is allocated once, and the left half's next
+    permutation is computed inside its right half, which holds the left half
+    reversed:
+        - the longest non-increasing suffix of the left half is the longest
+          non-decreasing prefix of that reversed copy (one regex match),
+        - the digit to swap with the pivot is found with `bisect`,
+        - the suffix reversal is a single slice assignment.
+    The new left half is then mirrored back into the front of the buffer.
+
+    Returns:
+        The next palindrome as bytes, or b"" if none exists.
+
+    Raises:
+        ValueError: If the input is not made of ASCII digits only.
+    """
+    n = len(data)
+    if n <= 1:
+        return b""
+    if not _DIGITS.fullmatch(data):
+        raise ValueError("input must contain ASCII digits only")
 
-    return True
+    h = n // 2
+    r = n - h  # start of the right half (the mirrored left half)
+
+    out = bytearray(n)
+    out[n - 1 : r - 1 : -1] = data[:h]
+    if n % 2:
+        out[h] = data[h]
+
+    # Non-increasing suffix of left == non-decreasing prefix of out[r:]
+    run = _NON_DECREASING.match(out, r).end() - r
+    if run == h:
+        return b""
+
+    # Pivot is left[h - 1 - run], i.e. out[r + run]; swap it with the
+    # rightmost larger digit of the suffix, the first larger one in out[r:]
+    pivot = r + run
+    swap = bisect_right(out, out[pivot], r, pivot)
+    out[pivot], out[swap] = out[swap], out[pivot]
+
+    # Reverse the left suffix (a prefix of the reversed copy)
+    out[r:pivot] = out[r:pivot][::-1]
+
+    # Mirror the new left half to the front
+    out[:h] = out[n - 1 : r - 1 : -1]
+    return bytes(out)
 
 
 def find_next_palindrome(num_str: str) -> str:
@@ -41,6 +133,24 @@ def find_next_palindrome(num_str: str) -> str:
     Given a numeric string, compute the next palindrome that can be formed by
     taking the left half, finding its next permutation, and mirroring it.
 
+    Delegates to the byte-level `find_next_palindrome_bytes`; the reference
+    digit-list version is `find_next_palindrome_reference`, which also
+    handles strings with non-ASCII digits (e.g. "١٢٢١" -> "2112", since
+    `int()` reads any Unicode decimal digit).
+
+    Returns:
+        The next palindrome as a string, or an empty string if none exists.
+    """
+    if not num_str.isascii():
+        return find_next_palindrome_reference(num_str)
+    return find_next_palindrome_bytes(num_str.encode("ascii")).decode("ascii")
+
+
+def find_next_palindrome_reference(num_str: str) -> str:
+    """
+    Reference implementation of `find_next_palindrome` on a list of ints,
+    using `next_permutation`.
+
     Returns:
         The next palindrome as a string, or an empty string if none exists.
     """
@@ -61,106 +171,304 @@ def find_next_palindrome(num_str: str) -> str:
     return "".join(str(d) for d in left + middle + left[::-1])
 
 
-# ==========================
-#        UNIT TESTS
-# ==========================
-class TestNextPermutation(unittest.TestCase):
-    """Unit tests for the next_permutation function."""
-
-    def test_simple_increase(self):
-        """Simple case: 123 -> 132"""
-        digits = [1, 2, 3]
-        result = next_permutation(digits)
-        self.assertTrue(result)
-        self.assertEqual(digits, [1, 3, 2])
-
-    def test_multiple_steps(self):
-        """Multiple steps: 132 -> 213"""
-        digits = [1, 3, 2]
-        result = next_permutation(digits)
-        self.assertTrue(result)
-        self.assertEqual(digits, [2, 1, 3])
-
-    def test_already_max(self):
-        """Already the largest permutation: 321 -> no next"""
-        digits = [3, 2, 1]
-        result = next_permutation(digits)
-        self.assertFalse(result)
-        self.assertEqual(digits, [3, 2, 1])
-
-    def test_all_equal(self):
-        """All digits equal: 111 -> no next"""
-        digits = [1, 1, 1]
-        result = next_permutation(digits)
-        self.assertFalse(result)
-        self.assertEqual(digits, [1, 1, 1])
-
-    def test_in_place_behavior(self):
-        """Check that the input list is modified in-place."""
-        digits = [1, 2, 3]
-        ref = digits
-        next_permutation(digits)
-        self.assertIs(digits, ref)  # same object, modified in-place
-
-
-class TestFindNextPalindrome(unittest.TestCase):
-    """Unit tests for the find_next_palindrome function."""
-
-    def test_example_from_statement(self):
-        """Example given in the problem statement."""
-        self.assertEqual(find_next_palindrome("123321"), "132231")
-
-    def test_even_length(self):
-        """Even length case: 1221 -> 2112"""
-        self.assertEqual(find_next_palindrome("1221"), "2112")
-
-    def test_odd_length(self):
-        """Odd length case: 12321 -> 21312"""
-        self.assertEqual(find_next_palindrome("12321"), "21312")
-
-    def test_all_digits_equal(self):
-        """All digits equal: 111111 -> no next"""
-        self.assertEqual(find_next_palindrome("111111"), "")
-        self.assertEqual(find_next_palindrome("999999"), "")
-
-    def test_single_digit(self):
-        """Single digit case: no next palindrome"""
-        self.assertEqual(find_next_palindrome("1"), "")
-        self.assertEqual(find_next_palindrome("9"), "")
-
-    def test_already_largest(self):
-        """Input already yields the lexicographically largest
-        palindrome from these digits -> no next palindrome"""
-        self.assertEqual(find_next_palindrome("543345"), "")
-
-    def test_typical_even_case(self):
-        """Typical even-length case: 889988 -> 898898"""
-        self.assertEqual(find_next_palindrome("889988"), "898898")
-
-    def test_other_valid_case(self):
-        """Another valid case: 455554 -> 545545"""
-        self.assertEqual(find_next_palindrome("455554"), "545545")
-
-    def test_result_is_palindrome(self):
-        """Ensure the result (when non-empty) is actually a palindrome"""
-        s = "123321"
-        result = find_next_palindrome(s)
-        self.assertNotEqual(result, "")  # sanity: should exist
-        self.assertEqual(result, result[::-1])  # must be palindrome
-
-    def test_result_is_strictly_greater(self):
-        """ "Ensure the result (when non-empty) is strictly greater than input"""
-        s = "123321"
-        result = find_next_palindrome(s)
-        self.assertGreater(result, s)
-
-    def test_same_digits_multiset(self):
-        """Ensure the result (if any) uses exactly the same multiset of digits"""
-        for s in ["123321", "1221", "12321", "889988", "455554"]:
-            result = find_next_palindrome(s)
-            if result:
-                self.assertEqual(sorted(s), sorted(result))
+def iter_next_palindromes(
+    num_str: str, reuse_buffer: bool = False
+) -> Iterator[Union[str, bytearray]]:
+    """
+    Lazily yield the successive palindromes after `num_str`, in increasing
+    order, using the same digits.
+
+    The palindrome is kept in one bytearray. Each step advances its left
+    half with `_next_permutation_prefix` and re-mirrors only the positions
+    that changed, so the digit work is amortized O(1) per palindrome.
+
+    Args:
+        num_str: The starting numeric palindrome (not yielded itself).
+        reuse_buffer: If True, yield the same bytearray every time, updated
+            in place (copy it to keep a value). Otherwise yield a new str.
+
+    Yields:
+        Each next palindrome, starting with `find_next_palindrome(num_str)`.
+    """
+    n = len(num_str)
+    if n <= 1:
+        return
+
+    h = n // 2
+    out = bytearray(num_str.encode("ascii"))
+    if not out.isdigit():
+        raise ValueError("input must contain ASCII digits only")
+    out[n - h :] = out[h - 1 :: -1]  # palindrome built from the left half
+
+    while True:
+        i = _next_permutation_prefix(out, h)
+        if i < 0:
+            return
+
+        # Left positions i..h-1 changed; their mirrors are n-1-i..n-h
+        out[n - h : n - i] = out[i:h][::-1]
+        yield out if reuse_buffer else out.decode("ascii")
+
+
+def _digit_counts(digits: bytes) -> List[int]:
+    """Occurrences of each ASCII digit 0-9 in `digits`."""
+    return [digits.count(48 + d) for d in range(10)]
+
+
+def _permutation_rank(digits: bytes) -> int:
+    """
+    Rank of `digits` among the distinct permutations of its digit multiset.
+
+    `perms` is the number of distinct arrangements of the digits not placed
+    yet; those starting with digit c number perms * counts[c] // remaining,
+    so each position costs O(10) big-int operations.
+    """
+    counts = _digit_counts(digits)
+    remaining = len(digits)
+    perms = factorial(remaining)
+    for c in counts:
+        perms //= factorial(c)
+
+    rank = 0
+    for ch in digits:
+        d = ch - 48
+        smaller = sum(counts[:d])
+        rank += perms * smaller // remaining
+        perms = perms * counts[d] // remaining
+        counts[d] -= 1
+        remaining -= 1
+    return rank
+
+
+def _permutation_unrank(counts: List[int], rank: int) -> bytearray:
+    """Inverse of `_permutation_rank` for the digit multiset `counts`."""
+    counts = counts[:]
+    remaining = sum(counts)
+    perms = factorial(remaining)
+    for c in counts:
+        perms //= factorial(c)
+
+    out = bytearray()
+    while remaining:
+        for d in range(10):
+            if not counts[d]:
+                continue
+            block = perms * counts[d] // remaining
+            if rank < block:
+                out.append(48 + d)
+                perms = block
+                counts[d] -= 1
+                remaining -= 1
+                break
+            rank -= block
+    return out
+
+
+def kth_next_palindrome(num_str: str, k: int) -> str:
+    """
+    Return the palindrome `k` steps after `num_str` among the palindromes
+    with the same digits, without stepping through the ones in between.
+
+    The left half is ranked among the permutations of its digit multiset,
+    `k` is added, and the new rank is unranked with multinomial counting
+    over the 10 digit buckets: roughly O(10 * n) big-int operations, for
+    any k. `kth_next_palindrome(s, 1) == find_next_palindrome(s)`.
+
+    Returns:
+        The palindrome as a string, or an empty string if fewer than `k`
+        palindromes follow `num_str` (or if the rank would go below 0).
+    """
+    n = len(num_str)
+    data = num_str.encode("ascii")
+    if n and not data.isdigit():
+        raise ValueError("input must contain ASCII digits only")
+
+    h = n // 2
+    left = data[:h]
+    counts = _digit_counts(left)
+
+    total = factorial(h)
+    for c in counts:
+        total //= factorial(c)
+
+    rank = _permutation_rank(left) + k
+    if not 0 <= rank < total:
+        return ""
+
+    new_left = _permutation_unrank(counts, rank)
+    middle = data[h : n - h]
+    return (new_left + middle + new_left[::-1]).decode("ascii")
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with hit/miss counters.
+
+    Used by `find_next_palindrome_batch` to remember the next permutation of
+    left halves across batches.
+    """
+
+    def __init__(self, maxsize: int = 1 << 16) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[bytes, Optional[bytes]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._data
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Return the cached value (counting a hit), or raise KeyError (a miss)."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: bytes, value: Optional[bytes]) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def info(self) -> Dict[str, int]:
+        """Counters and occupancy, as a dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+# Shared cache used when find_next_palindrome_batch gets no explicit cache
+BATCH_CACHE = LRUCache()
+
+# Smallest group of same-length left halves sent to the NumPy engine
+NUMPY_MIN_GROUP = 64
+
+
+def _next_left_halves_numpy(lefts: List[bytes]) -> List[Optional[bytes]]:
+    """
+    Next permutation of many same-length digit strings at once (NumPy).
+
+    Per row: the pivot is the last i with a[i] < a[i + 1], the swap target
+    the last j > i with a[j] > a[i], and the suffix after i is reversed
+    with one gather through a per-row index matrix.
+    """
+    _numpy()
+    h = len(lefts[0])
+    a = np.frombuffer(b"".join(lefts), dtype=np.uint8).reshape(len(lefts), h).copy()
+    rows = np.arange(len(lefts))
+    cols = np.arange(h)
+
+    ascent = a[:, :-1] < a[:, 1:]
+    has_next = ascent.any(axis=1)
+    pivot = h - 2 - np.argmax(ascent[:, ::-1], axis=1)
+
+    pivot_val = a[rows, pivot]
+    larger = (a > pivot_val[:, None]) & (cols > pivot[:, None])
+    swap = h - 1 - np.argmax(larger[:, ::-1], axis=1)
+    a[rows, pivot], a[rows, swap] = a[rows, swap], pivot_val
+
+    # Reverse a[i + 1:] in every row: column c reads from h + i - c
+    source = np.where(cols > pivot[:, None], h + pivot[:, None] - cols, cols)
+    a = np.take_along_axis(a, source, axis=1)
+
+    return [row.tobytes() if ok else None for row, ok in zip(a, has_next)]
+
+
+def _next_left_half(left: bytes) -> Optional[bytes]:
+    """Next permutation of one digit string, or None if it is the highest."""
+    buf = bytearray(left)
+    return bytes(buf) if _next_permutation_prefix(buf, len(buf)) >= 0 else None
+
+
+def find_next_palindrome_batch(
+    strings: Iterable[str], cache: Optional[LRUCache] = None
+) -> List[str]:
+    """
+    `find_next_palindrome` for a whole batch of numeric strings.
+
+    The result only depends on the left half (the middle digit is copied
+    through), so inputs are grouped by left half and middle digit:
+        - each distinct left half is looked up once in the LRU cache,
+        - cache misses of the same length are advanced together with NumPy
+          when the group is large enough, one by one otherwise,
+        - each distinct (left half, middle) output is built once.
+
+    Args:
+        strings: Numeric palindromes.
+        cache: LRU cache of left half -> next left half (None if there is no
+            next permutation). Defaults to the module-level BATCH_CACHE.
+
+    Returns:
+        The next palindrome of each input, "" where none exists.
+    """
+    if cache is None:
+        cache = BATCH_CACHE
+
+    # Group inputs by (left half, middle digit)
+    groups: Dict[Tuple[bytes, bytes], List[int]] = {}
+    results: List[str] = []
+    for pos, num_str in enumerate(strings):
+        results.append("")
+        n = len(num_str)
+        if n <= 1:
+            continue
+        if not num_str.isascii():
+            results[pos] = find_next_palindrome_reference(num_str)
+            continue
+        data = num_str.encode("ascii")
+        if not data.isdigit():
+            raise ValueError("input must contain ASCII digits only")
+        h = n // 2
+        left, middle = data[:h], data[h : n - h]
+        groups.setdefault((left, middle), []).append(pos)
+
+    # Resolve each distinct left half: cache first, then by length group
+    next_left: Dict[bytes, Optional[bytes]] = {}
+    misses: Dict[int, List[bytes]] = {}
+    for left in {left for left, _ in groups}:
+        try:
+            next_left[left] = cache.get(left)
+        except KeyError:
+            misses.setdefault(len(left), []).append(left)
+
+    for lefts in misses.values():
+        vectorize = len(lefts) >= NUMPY_MIN_GROUP and len(lefts[0]) > 1
+        if vectorize and _numpy() is not None:
+            advanced = _next_left_halves_numpy(lefts)
+        else:
+            advanced = [_next_left_half(left) for left in lefts]
+        for left, new_left in zip(lefts, advanced):
+            next_left[left] = new_left
+            cache.put(left, new_left)
+
+    # Build each distinct palindrome once and fan it out
+    for (left, middle), positions in groups.items():
+        new_left = next_left[left]
+        if new_left is None:
+            continue
+        palindrome = (new_left + middle + new_left[::-1]).decode("ascii")
+        for pos in positions:
+            results[pos] = palindrome
+
+    return results
 
 
 if __name__ == "__main__":
-    unittest.main()
+    import sys
+    import unittest
+    from pathlib import Path
+
+    # The tests live in two-pointers/tests, out of this module's import path
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    unittest.main(module="tests.test_next_palindrome_same_digits")
@@ -1,3 +1,9 @@
+import concurrent.futures
+import mmap
+import os
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+
 def reverse(word: list[str], left: int, right: int):
     """Reverse the portion of the list word from left to right (inclusive).
     Args:
@@ -79,7 +85,200 @@ def reverse_words(sentence: str) -> str:
     return remove_extra_spaces(s)
 
 
+def reverse_words_bytes(data: Union[bytes, bytearray, memoryview]) -> bytes:
+    """Reverse the words of an ASCII/UTF-8 byte string.
+    `bytes.split()` already cuts the sentence into words at ASCII
+    whitespace (dropping the empty ones) in C, so joining them back in
+    reverse order with single spaces gives the result of `reverse_words`
+    without any per-character loop. Multi-byte UTF-8 characters are never
+    split, since no byte of them is ASCII whitespace.
+    Args:
+        data: Input sentence as bytes (ASCII whitespace separates words)
+    Returns:
+        bytes: Sentence with words reversed.
+    """
+    return b" ".join(reversed(bytes(data).split()))
+
+
+def reverse_words_file(path: str, out: BinaryIO, buffer_size: int = 1 << 20) -> None:
+    """Reverse the words of a (possibly huge) file and write them to `out`.
+    The input is memory-mapped and read backwards in blocks of
+    `buffer_size` bytes. Each block is split into words, which are written
+    in reverse order as one buffered write; a word cut by the block
+    boundary is carried over as a list of pieces, joined once when the
+    block holding its start is read. Memory use is bounded by the buffer
+    size plus the longest word.
+    Words are separated by ASCII whitespace; for space-separated text the
+    output is the same as `reverse_words` encoded.
+    Args:
+        path: Path of the input file (str)
+        out: Binary stream receiving the reversed sentence
+        buffer_size: Bytes read per block (int)
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with mm:
+        # A word cut by block starts, as its pieces from right to left
+        pieces: List[bytes] = []
+        wrote = False
+        hi = size
+
+        while hi > 0:
+            lo = max(0, hi - buffer_size)
+            block = mm[lo:hi]
+            words = block.split()
+            # The first word may continue further left
+            cut = lo > 0 and bool(words) and not block[:1].isspace()
+
+            done = []
+            if pieces:
+                if words and not block[-1:].isspace():
+                    pieces.append(words.pop())
+                    if cut and not words:
+                        hi = lo  # the whole block lies inside the word
+                        continue
+                # The carried word starts here: join its pieces only once
+                done.append(b"".join(reversed(pieces)))
+                pieces = []
+            if cut and words:
+                pieces.append(words.pop(0))
+            done.extend(reversed(words))
+
+            if done:
+                if wrote:
+                    out.write(b" ")
+                out.write(b" ".join(done))
+                wrote = True
+            hi = lo
+
+        if pieces:
+            if wrote:
+                out.write(b" ")
+            out.write(b"".join(reversed(pieces)))
+
+
+def _line_ranges(mm: mmap.mmap, parts: int) -> List[Tuple[int, int]]:
+    """Split the mapped file into up to `parts` byte ranges ending at newlines.
+    Args:
+        mm: The mapped input file
+        parts: Number of ranges wanted (int)
+    Returns:
+        List of (start, end) byte offsets, in order.
+    """
+    size = len(mm)
+    bounds = [0]
+    for t in range(1, parts):
+        newline = mm.find(b"\n", max(bounds[-1], size * t // parts))
+        if newline == -1:
+            break
+        if newline + 1 > bounds[-1]:
+            bounds.append(newline + 1)
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _reverse_lines_range(
+    src: str, dst: str, start: int, end: int, buffer_size: int = 1 << 20
+) -> int:
+    """Worker: reverse every line of src[start:end] into dst at offset `start`.
+    A reversed line is never longer than the original, so the output of a
+    range fits in the same region of the output file.
+    Args:
+        src: Input path (str)
+        dst: Output path, preallocated to the input size (str)
+        start: First byte of the range (int)
+        end: End of the range, just after a newline or at EOF (int)
+        buffer_size: Bytes gathered before each write (int)
+    Returns:
+        int: Number of bytes written.
+    """
+    with open(src, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    written = 0
+    fd = os.open(dst, os.O_WRONLY)
+    try:
+        pending: List[bytes] = []
+        pending_size = 0
+        pos = start
+        while pos < end:
+            newline = mm.find(b"\n", pos, end)
+            stop = end if newline == -1 else newline
+            line = reverse_words_bytes(mm[pos:stop])
+            if newline != -1:
+                line += b"\n"
+            pending.append(line)
+            pending_size += len(line)
+            pos = stop + 1
+
+            if pending_size >= buffer_size or pos >= end:
+                written += os.pwrite(fd, b"".join(pending), start + written)
+                pending, pending_size = [], 0
+    finally:
+        os.close(fd)
+        mm.close()
+    return written
+
+
+def reverse_words_lines_parallel(
+    src: str, dst: str, workers: Optional[int] = None
+) -> None:
+    """Reverse the words of every line of `src` into `dst`, on all cores.
+    The input is split into byte ranges aligned to newline boundaries.
+    Each range is processed by a worker process, which writes its output
+    into the same region of `dst` (reversed lines never grow). The regions
+    are then stitched together in input order by moving each one left over
+    the gap left by the previous ranges, and the file is truncated.
+    Lines are reversed with `reverse_words_bytes` and keep their newline.
+    Args:
+        src: Input path (str)
+        dst: Output path (str)
+        workers: Number of worker processes (defaults to the CPU count)
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(src)
+
+    with open(dst, "wb") as f:
+        f.truncate(size)
+    if size == 0:
+        return
+
+    with open(src, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = _line_ranges(mm, workers)
+
+    executor = concurrent.futures.ProcessPoolExecutor
+    with executor(max_workers=min(workers, len(ranges))) as pool:
+        futures = [
+            pool.submit(_reverse_lines_range, src, dst, start, end)
+            for start, end in ranges
+        ]
+        lengths = [future.result() for future in futures]
+
+    # Stitch: move every region left so the outputs are contiguous
+    fd = os.open(dst, os.O_RDWR)
+    try:
+        pos = 0
+        for (start, _), length in zip(ranges, lengths):
+            if start != pos:
+                for offset in range(0, length, 1 << 20):
+                    block = os.pread(fd, min(1 << 20, length - offset), start + offset)
+                    os.pwrite(fd, block, pos + offset)
+            pos += length
+        os.ftruncate(fd, pos)
+    finally:
+        os.close(fd)
+
+
 def main():
+    import io  # only the file-mode checks need these
+    import tempfile
+
     tests = [
         ("hello world", "world hello"),
         ("  hello world  ", "world hello"),
@@ -110,6 +309,38 @@ def main():
         if out != expected:
             all_passed = False
 
+    # bytes engine
+    for inp, expected in tests:
+        if reverse_words_bytes(inp.encode()).decode() != expected:
+            print(f"Bytes engine FAIL: {inp!r}")
+            all_passed = False
+
+    # File mode, with tiny buffers so words straddle block boundaries
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sentence.txt")
+        for inp, expected in tests:
+            with open(path, "w") as f:
+                f.write(inp)
+            for buffer_size in (1, 2, 3, 1 << 20):
+                buf = io.BytesIO()
+                reverse_words_file(path, buf, buffer_size=buffer_size)
+                if buf.getvalue().decode() != expected:
+                    print(f"File mode FAIL: {inp!r} (buffer_size={buffer_size})")
+                    all_passed = False
+
+    # Parallel multi-line mode: one sample case per line, in order
+    with tempfile.TemporaryDirectory() as tmp:
+        src, dst = os.path.join(tmp, "corpus.txt"), os.path.join(tmp, "out.txt")
+        with open(src, "w") as f:
+            f.write("\n".join(inp for inp, _ in tests * 50))
+        for workers in (1, 3, 8):
+            reverse_words_lines_parallel(src, dst, workers=workers)
+            with open(dst) as f:
+                got = f.read()
+            if got != "\n".join(expected for _, expected in tests * 50):
+                print(f"Parallel mode FAIL (workers={workers})")
+                all_passed = False
+
     if all_passed:
         print("ALL TESTS PASSED!")
     else:
@@ -0,0 +1,191 @@
+"""Unit tests for two_pointers/dispatch.py."""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+
+import two_pointers
+from two_pointers import dispatch, load_solution
+from two_pointers.dispatch import Calibration, Probe, host_key, measure
+
+
+def _forced(tmp, fast=None):
+    """A calibration in `tmp` sending threshold `fast` (only) to the fast engine."""
+    calibration = Calibration(os.path.join(tmp, "calibration.json"))
+    for name in dispatch.PROBES:
+        calibration.put(name, 0 if name == fast else None)
+    return calibration
+
+
+class TestMeasure(unittest.TestCase):
+    """Unit tests for the crossover search."""
+
+    @staticmethod
+    def probe(crossover):
+        # The fast engine is ~10x slower below `crossover` and free from it on
+        return Probe(
+            [16, 32, 64, 128, 256],
+            lambda n, rng: (n,),
+            lambda n: sum(range(5000)),
+            lambda n: sum(range(50000)) if n < crossover else None,
+        )
+
+    def test_finds_crossover(self):
+        self.assertEqual(measure(self.probe(64)), 64)
+        self.assertEqual(measure(self.probe(16)), 16)
+
+    def test_no_crossover(self):
+        self.assertIsNone(measure(self.probe(10**9)))
+
+    def test_unavailable_probe(self):
+        probe = self.probe(16)._replace(available=lambda: False)
+        self.assertIsNone(measure(probe))
+
+    def test_budget_stops_the_ladder(self):
+        """A zero budget measures the first size only"""
+        self.assertIsNone(measure(self.probe(32), budget=0))
+
+
+class TestCalibration(unittest.TestCase):
+    """Unit tests for the on-disk threshold cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sub", "calibration.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_measures_once_and_caches(self):
+        calibration = Calibration(self.path, budget=0.2)
+        threshold = calibration.get("reverse_words.bytes")
+        with open(self.path) as f:
+            cached = json.load(f)[host_key()]["reverse_words.bytes"]
+        self.assertEqual(cached, threshold)
+
+        # A new instance reads the cache instead of measuring
+        with open(self.path, "w") as f:
+            json.dump({host_key(): {"reverse_words.bytes": 12345}}, f)
+        self.assertEqual(Calibration(self.path).get("reverse_words.bytes"), 12345)
+
+    def test_keeps_other_hosts(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as f:
+            json.dump({"other-host": {"maxsum.numpy": 7}}, f)
+        Calibration(self.path).put("maxsum.numpy", 9)
+        with open(self.path) as f:
+            data = json.load(f)
+        self.assertEqual(data["other-host"], {"maxsum.numpy": 7})
+        self.assertEqual(data[host_key()], {"maxsum.numpy": 9})
+
+    def test_corrupt_cache_is_ignored(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        calibration = Calibration(self.path)
+        calibration.put("maxsum.numpy", None)
+        self.assertIsNone(calibration.get("maxsum.numpy"))
+
+    def test_unknown_threshold(self):
+        with self.assertRaises(KeyError):
+            Calibration(self.path).get("nope")
+
+
+class TestDispatch(unittest.TestCase):
+    """Every route gives the result of the reference engine."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.rng = random.Random(0)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def routes(self, name):
+        """A calibration that never and one that always takes the fast path"""
+        return [_forced(self.tmp.name), _forced(self.tmp.name, name)]
+
+    def test_package_names_are_dispatchers(self):
+        self.assertIs(two_pointers.maxsum, dispatch.maxsum)
+        self.assertIs(two_pointers.reverse_words, dispatch.reverse_words)
+
+    def test_maxsum(self):
+        mod = load_solution("get-maximum-score")
+        for name in ("maxsum.numpy", "maxsum.parallel"):
+            for calibration in self.routes(name):
+                for n in (0, 1, 10, 500):
+                    a = sorted(self.rng.sample(range(4 * n + 1), n))
+                    b = sorted(self.rng.sample(range(4 * n + 1), n))
+                    self.assertEqual(
+                        dispatch.maxsum(a, b, calibration=calibration),
+                        mod._maxsum_walk(a, b),
+                    )
+
+    def test_maxsum_overflow_and_iterators(self):
+        """Values beyond int64 and non-list inputs still get exact results"""
+        a = [2**62, 2**64]
+        for calibration in self.routes("maxsum.parallel"):
+            self.assertEqual(
+                dispatch.maxsum(a, a, calibration=calibration),
+                (2**62 + 2**64) % 1000000007,
+            )
+        calibration = _forced(self.tmp.name)
+        self.assertEqual(
+            dispatch.maxsum(iter([1, 3, 5]), iter([3, 4]), calibration=calibration), 9
+        )
+
+    def test_max_number(self):
+        mod = load_solution("create-maximum-number")
+        for calibration in self.routes("max_number.parallel"):
+            for _ in range(20):
+                a = [self.rng.randrange(10) for _ in range(self.rng.randint(0, 8))]
+                b = [self.rng.randrange(10) for _ in range(self.rng.randint(0, 8))]
+                k = self.rng.randint(0, len(a) + len(b))
+                self.assertEqual(
+                    dispatch.max_number(a, b, k, calibration=calibration),
+                    mod.max_number(a, b, k),
+                )
+
+    def test_find_next_palindrome(self):
+        mod = load_solution("next-palindrome-same-digits")
+        strings = ["1221", "12321", "4334", "9", "", "321123", "1221"]
+        expected = [mod.find_next_palindrome(s) for s in strings]
+        for calibration in self.routes("find_next_palindrome.batch"):
+            self.assertEqual(
+                dispatch.find_next_palindrome(iter(strings), calibration=calibration),
+                expected,
+            )
+        calibration = _forced(self.tmp.name)
+        self.assertEqual(dispatch.find_next_palindrome("1221", calibration), "2112")
+        self.assertEqual(dispatch.find_next_palindrome(b"1221", calibration), b"2112")
+
+    def test_reverse_words(self):
+        mod = load_solution("reverse-word-string")
+        sentences = [
+            "",
+            "   ",
+            "  the sky   is blue ",
+            "tabs\tand\nnewlines  stay",
+            "\x1cseparator x",
+            "héllo wörld",
+            "a　b c",
+        ]
+        for _ in range(50):
+            words = ["".join(self.rng.choices("ab", k=self.rng.randint(1, 3)))]
+            words += [" " * self.rng.randint(0, 3) for _ in range(5)]
+            self.rng.shuffle(words)
+            sentences.append("x".join(words))
+        for calibration in self.routes("reverse_words.bytes"):
+            for sentence in sentences:
+                self.assertEqual(
+                    dispatch.reverse_words(sentence, calibration),
+                    mod.reverse_words(sentence),
+                )
+        calibration = _forced(self.tmp.name)
+        self.assertEqual(dispatch.reverse_words(b" a  b ", calibration), b"b a")
+
+
+if __name__ == "__main__":
+    unittest.main()
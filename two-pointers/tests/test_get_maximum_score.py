@@ -0,0 +1,346 @@
+"""Unit tests for get-maximum-score/solution.py."""
+
+import mmap
+import random
+import tempfile
+import unittest
+from array import array
+from multiprocessing import shared_memory
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+import two_pointers.get_maximum_score as solution
+from two_pointers.get_maximum_score import (
+    _find_cuts,
+    CHUNK_SIZE,
+    MaxScoreIndex,
+    maxsum,
+    maxsum_chunked,
+    maxsum_multi,
+    maxsum_numpy,
+    maxsum_parallel,
+    MOD,
+    VECTOR_THRESHOLD,
+)
+
+
+class TestMaxSum(unittest.TestCase):
+    """Unit tests for the maxsum function."""
+
+    def test_basic(self):
+        """Basic test case from the prompt."""
+        self.assertEqual(maxsum([1, 3, 5, 7, 9], [1, 2, 3, 4, 5]), 31)
+
+    def test_no_shared(self):
+        """With no shared elements, you just pick the array with the largest sum"""
+        a = [1, 2, 3]
+        b = [4, 5, 6]
+        expected = max(sum(a), sum(b)) % MOD
+        self.assertEqual(maxsum(a, b), expected)
+
+    def test_all_shared(self):
+        """All elements shared -> you effectively traverse a single set of uniques"""
+        a = [1, 2, 3]
+        b = [1, 2, 3]
+        expected = sum(a) % MOD
+        self.assertEqual(maxsum(a, b), expected)
+
+    def test_shared_in_middle(self):
+        """Shared elements in the middle of the arrays"""
+        a = [2, 4, 6, 8]
+        b = [1, 6, 7, 9]
+        expected = (max(2 + 4 + 6, 1 + 6) + max(8, 7 + 9)) % MOD  # 28
+        self.assertEqual(maxsum(a, b), expected)
+
+    def test_single_element(self):
+        """Single shared element => counted once"""
+        self.assertEqual(maxsum([5], [5]), 5)
+
+    def test_large_values(self):
+        """Large value, ensure modulo is applied correctly"""
+        x = 10**9
+        expected = x % MOD
+        self.assertEqual(maxsum([x], [x]), expected)
+
+    def test_one_empty(self):
+        """If one array is empty, you must take the other completely"""
+        self.assertEqual(maxsum([], [1, 2, 3]), sum([1, 2, 3]) % MOD)
+        self.assertEqual(maxsum([1, 2, 3], []), sum([1, 2, 3]) % MOD)
+
+
+class TestMaxSumChunked(unittest.TestCase):
+    """Unit tests for the out-of-core maxsum engine."""
+
+    CASES = [
+        ([1, 3, 5, 7, 9], [1, 2, 3, 4, 5]),
+        ([2, 4, 6, 8], [1, 6, 7, 9]),
+        ([1, 2, 3], [4, 5, 6]),
+        ([], [1, 2, 3]),
+        ([1, 2, 3], []),
+        ([], []),
+        (list(range(0, 300, 2)), list(range(0, 300, 3))),
+    ]
+
+    def test_iterators_match_lists(self):
+        """Generators give the same result as lists, for any chunk size"""
+        for a, b in self.CASES:
+            for chunk_size in (1, 2, 7, CHUNK_SIZE):
+                self.assertEqual(
+                    maxsum(iter(a), (x for x in b), chunk_size=chunk_size),
+                    maxsum(a, b),
+                )
+
+    def test_buffer_inputs(self):
+        """array('q') buffers are walked through memoryview slices"""
+        for a, b in self.CASES:
+            self.assertEqual(
+                maxsum(array("q", a), array("q", b), chunk_size=3), maxsum(a, b)
+            )
+
+    def test_mmap_input(self):
+        """A raw int64 file mapped with mmap is read in place"""
+        a, b = self.CASES[-1]
+        with tempfile.TemporaryFile() as f:
+            f.write(array("q", a).tobytes())
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self.assertEqual(maxsum(mm, b, chunk_size=16), maxsum(a, b))
+
+
+class TestMaxSumParallel(unittest.TestCase):
+    """Unit tests for the shared-memory parallel maxsum."""
+
+    def test_matches_serial(self):
+        """Chunked scores recombine to the serial result"""
+        cases = [
+            (list(range(0, 3000, 2)), list(range(0, 3000, 3))),
+            (list(range(1, 2000, 2)), list(range(0, 2000, 2))),  # no shared
+            ([1, 3, 5, 7, 9], [1, 2, 3, 4, 5]),
+            ([], [1, 2, 3]),
+        ]
+        for a, b in cases:
+            for workers in (1, 2, 3):
+                self.assertEqual(maxsum_parallel(a, b, workers=workers), maxsum(a, b))
+
+    def test_repeated_values(self):
+        """Arrays that repeat values are not cut, and score like the walk"""
+        rng = random.Random(5)
+        a = sorted(rng.randrange(1000) for _ in range(3000))
+        b = sorted(rng.randrange(1000) for _ in range(3000))
+        for workers in (2, 3):
+            self.assertEqual(
+                maxsum_parallel(a, b, workers=workers), solution._maxsum_walk(a, b)
+            )
+
+    def test_cuts_are_shared(self):
+        """Every cut is a shared value, strictly increasing in both arrays"""
+        a, b = list(range(0, 1000, 2)), list(range(0, 1000, 7))
+        cuts = _find_cuts(a, b, 8)
+        self.assertTrue(cuts)
+        for (i, j), (i2, j2) in zip(cuts, cuts[1:]):
+            self.assertLess(i, i2)
+            self.assertLess(j, j2)
+        for i, j in cuts:
+            self.assertEqual(a[i], b[j])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_cuts_numpy_match_bisect(self):
+        """Block-wise searchsorted finds the same cuts as bisect"""
+        rng = random.Random(3)
+        for density in (0.5, 0.01, 0.0):
+            a = sorted(rng.sample(range(20000), 5000))
+            b = sorted(x for x in range(20000) if x % 2 or rng.random() < density)
+            for parts in (2, 4, 7):
+                self.assertEqual(
+                    _find_cuts(np.array(a), np.array(b), parts),
+                    _find_cuts(a, b, parts),
+                )
+
+    def test_overflow_leaves_nothing_shared(self):
+        """A value beyond int64 raises before any block is created or leaked"""
+        created = []
+        to_shared = solution._to_shared
+
+        def record(data):
+            if created:
+                raise MemoryError("second block")
+            shm = to_shared(data)
+            created.append(shm.name)
+            return shm
+
+        with self.assertRaises(OverflowError):
+            maxsum_parallel([1, 2, 3], [2, 2**64], workers=2)
+
+        # A failure after the first block still unlinks it
+        a = list(range(0, 3000, 2))
+        with mock.patch.object(solution, "_to_shared", record):
+            with self.assertRaises(MemoryError):
+                maxsum_parallel(a, a, workers=2)
+        self.assertEqual(len(created), 1)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=created[0])
+
+
+class TestMaxSumMulti(unittest.TestCase):
+    """Unit tests for the k-way maxsum generalization."""
+
+    @staticmethod
+    def brute(arrays):
+        """Enumerate every path explicitly (small inputs only)."""
+        where = {}
+        for a, arr in enumerate(arrays):
+            for i, v in enumerate(arr):
+                where.setdefault(v, []).append((a, i))
+
+        def walk(a, i):
+            if i == len(arrays[a]):
+                return 0
+            v = arrays[a][i]
+            return v + max(walk(b, j + 1) for b, j in where[v])
+
+        return max([walk(a, 0) for a in range(len(arrays))] + [0]) % MOD
+
+    def test_two_arrays_match_maxsum(self):
+        """With two arrays the result equals maxsum"""
+        for a, b in TestMaxSumChunked.CASES:
+            self.assertEqual(maxsum_multi([a, b]), maxsum(a, b))
+
+    def test_three_arrays(self):
+        """Switch through a value shared by a subset of the arrays"""
+        arrays = [[1, 5, 20], [2, 5, 6, 7], [3, 7, 8]]
+        # 2 -> 5 -> 6 -> 7 -> 8 = 28 beats 2 -> 5 -> 20 = 27
+        self.assertEqual(maxsum_multi(arrays), 28)
+        self.assertEqual(maxsum_multi(arrays), self.brute(arrays))
+
+    def test_random_against_brute_force(self):
+        """Random small instances agree with explicit path enumeration"""
+        rng = random.Random(0)
+        for _ in range(200):
+            arrays = [
+                sorted(rng.sample(range(1, 15), rng.randint(0, 6)))
+                for _ in range(rng.randint(1, 4))
+            ]
+            self.assertEqual(maxsum_multi(arrays), self.brute(arrays))
+
+    def test_empty(self):
+        """No arrays, or only empty arrays, score 0"""
+        self.assertEqual(maxsum_multi([]), 0)
+        self.assertEqual(maxsum_multi([[], []]), 0)
+
+
+class TestMaxScoreIndex(unittest.TestCase):
+    """Unit tests for the incremental maximum-score index."""
+
+    def test_initial_score(self):
+        """A freshly built index scores like maxsum"""
+        for a, b in TestMaxSumChunked.CASES:
+            self.assertEqual(MaxScoreIndex(a, b).score(), maxsum(a, b))
+
+    def test_docstring_example(self):
+        """Inserting a value into nums2 updates the affected segment only"""
+        index = MaxScoreIndex([1, 3, 5, 7, 9], [1, 2, 3, 4, 5])
+        self.assertEqual(index.score(), 31)
+        index.insert(1, 20)
+        self.assertEqual(index.score(), 35)
+
+    def test_random_updates(self):
+        """Random inserts and deletes always agree with a full recomputation"""
+        rng = random.Random(1)
+        index = MaxScoreIndex()
+        sides = (set(), set())
+        for _ in range(600):
+            side, value = rng.randint(0, 1), rng.randint(-20, 40)
+            if value in sides[side]:
+                index.delete(side, value)
+                sides[side].discard(value)
+            else:
+                index.insert(side, value)
+                sides[side].add(value)
+            expected = maxsum(sorted(sides[0]), sorted(sides[1]))
+            self.assertEqual(index.score(), expected)
+
+    def test_invalid_updates(self):
+        """Duplicates and missing values are rejected"""
+        index = MaxScoreIndex([1, 2], [2])
+        with self.assertRaises(ValueError):
+            index.insert(0, 1)
+        with self.assertRaises(ValueError):
+            index.delete(1, 1)
+
+    def test_many_updates(self):
+        """Enough values to split and empty blocks still agree with maxsum"""
+        rng = random.Random(2)
+        sides = (set(rng.sample(range(3000), 1000)), set(rng.sample(range(3000), 1000)))
+        index = MaxScoreIndex(sides[0], sides[1])
+        for step in range(3000):
+            side, value = rng.randint(0, 1), rng.randrange(3000)
+            if value in sides[side]:
+                index.delete(side, value)
+                sides[side].discard(value)
+            else:
+                index.insert(side, value)
+                sides[side].add(value)
+            if step % 100 == 0:
+                expected = maxsum(sorted(sides[0]), sorted(sides[1]))
+                self.assertEqual(index.score(), expected)
+        for value in sorted(sides[0]):
+            index.delete(0, value)
+        self.assertEqual(index.score(), sum(sides[1]) % MOD)
+
+    def test_values_beyond_int64(self):
+        """Any Python int is accepted, as in maxsum"""
+        low, high = -(2**70), 2**64
+        index = MaxScoreIndex([low, 0, high], [low, 2**63, high])
+        self.assertEqual(index.score(), maxsum([low, 0, high], [low, 2**63, high]))
+        index.delete(0, low)
+        index.insert(1, 2**65)
+        self.assertEqual(
+            index.score(), maxsum([0, high], [low, 2**63, high, 2**65])
+        )
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestMaxSumNumpy(unittest.TestCase):
+    """Unit tests for the vectorized maxsum engine."""
+
+    def test_matches_two_pointer(self):
+        """Random sorted arrays give the same score as the Python walk"""
+        rng = np.random.default_rng(0)
+        for density in (0.0, 0.1, 0.5, 1.0):
+            base = np.unique(rng.integers(1, 10**7, size=2000))
+            a = base[rng.random(len(base)) < 0.5]
+            shared = a[rng.random(len(a)) < density]
+            b = np.union1d(base[rng.random(len(base)) < 0.5], shared)
+            self.assertEqual(maxsum_numpy(a, b), maxsum_chunked(a.tolist(), b.tolist()))
+
+    def test_auto_selected_above_threshold(self):
+        """Large list inputs go through the vectorized engine transparently"""
+        a = list(range(0, 3 * VECTOR_THRESHOLD, 2))
+        b = list(range(0, 3 * VECTOR_THRESHOLD, 3))
+        self.assertEqual(maxsum(a, b), maxsum_chunked(a, b))
+
+    def test_overflow_falls_back(self):
+        """Sums beyond int64 fall back to the exact Python walk"""
+        a = [2**62, 2**62 + 1]
+        self.assertIsNone(maxsum_numpy(a, a))
+        self.assertEqual(maxsum(a, a), (2**63 + 1) % MOD)
+
+        # abs(INT64_MIN) does not fit int64 either
+        self.assertIsNone(maxsum_numpy([-(2**63), -10], [-5]))
+        self.assertEqual(maxsum([-(2**63), -10], [-5]), 1000000002)
+
+    def test_repeated_values_fall_back(self):
+        """Sorted arrays that repeat values are scored by the Python walk"""
+        rng = random.Random(5)
+        a = sorted(rng.randrange(1000) for _ in range(3000))
+        b = sorted(rng.randrange(1000) for _ in range(3000))
+        self.assertIsNone(maxsum_numpy(a, b))
+        self.assertEqual(maxsum(a, b), solution._maxsum_walk(a, b))
+
+
+if __name__ == "__main__":
+    unittest.main()
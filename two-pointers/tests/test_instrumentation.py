@@ -0,0 +1,199 @@
+"""Unit tests for two_pointers/instrumentation.py."""
+
+import logging
+import os
+import random
+import tempfile
+import unittest
+from typing import Iterator
+from unittest import mock
+
+from two_pointers import dispatch, instrumentation, load_solution
+from two_pointers.instrumentation import TIMED, VARIANTS
+
+
+def _current(key):
+    problem, attr = key
+    return getattr(load_solution(problem), attr)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """The instrumented variants behave like the originals and count work."""
+
+    def setUp(self):
+        self.rng = random.Random(0)
+        self.originals = {key: _current(key) for key in list(VARIANTS) + TIMED}
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def enable(self):
+        stats = instrumentation.enable()
+        self.assertIsNotNone(instrumentation.current())
+        return stats
+
+    def digits(self, n):
+        return [self.rng.randrange(10) for _ in range(n)]
+
+    def test_disable_restores_originals(self):
+        self.enable()
+        for key in self.originals:
+            self.assertIsNot(_current(key), self.originals[key], key)
+        instrumentation.disable()
+        for key, original in self.originals.items():
+            self.assertIs(_current(key), original, key)
+        self.assertIsNone(instrumentation.current())
+
+    def test_enable_is_idempotent(self):
+        stats = self.enable()
+        self.assertIs(instrumentation.enable(), stats)
+        instrumentation.disable()
+        for key, original in self.originals.items():
+            self.assertIs(_current(key), original, key)
+
+    def test_variants_match_originals(self):
+        """Every swapped-in function returns what the original returns"""
+        cmn = load_solution("create-maximum-number")
+        gms = load_solution("get-maximum-score")
+        itl = load_solution("intersection-two-linked-lists")
+        rws = load_solution("reverse-word-string")
+
+        cases = []
+        for _ in range(30):
+            nums = self.digits(self.rng.randint(0, 12))
+            other = self.digits(len(nums))
+            k = self.rng.randint(0, len(nums) + 1)
+            cases += [
+                ("_max_subsequence_stack", (nums, k)),
+                ("_max_subsequence_upgrade", (nums, k)),
+                ("merge", (nums, other)),
+                ("iter_merge", (nums, other)),
+                ("max_number", (nums, other, self.rng.randint(0, 2 * len(nums)))),
+            ]
+        cases = [(("create-maximum-number", attr), args) for attr, args in cases]
+
+        for _ in range(30):
+            values = sorted(self.rng.sample(range(60), self.rng.randint(0, 20)))
+            others = sorted(self.rng.sample(range(60), self.rng.randint(0, 20)))
+            cases.append((("get-maximum-score", "maxsum"), (values, others)))
+            cases.append((("get-maximum-score", "_maxsum_walk"), (values, others)))
+        # Large inputs are delegated to the original engines
+        big = list(range(0, 3 * gms.VECTOR_THRESHOLD, 2))
+        cases.append((("get-maximum-score", "maxsum"), (big, big[::3])))
+
+        def run(fn, args):
+            result = fn(*args)
+            return list(result) if isinstance(result, Iterator) else result
+
+        expected = [run(self.originals[key], args) for key, args in cases]
+        self.enable()
+        for (key, args), result in zip(cases, expected):
+            self.assertEqual(run(_current(key), args), result, (key, args))
+        self.assertEqual(gms.maxsum(iter([1, 3, 5]), iter([3, 4])), 9)
+
+        # Linked lists: the same intersection node; words: the same reversal
+        common = itl.build_list([7, 8])
+        head_a, head_b = itl.build_list([1, 2]), itl.build_list([3, 4, 5])
+        itl.connect_lists_at_node(head_a, common)
+        itl.connect_lists_at_node(head_b, common)
+        self.assertIs(itl.get_intersection_node(head_a, head_b), common)
+        self.assertIsNone(itl.get_intersection_node(head_a, itl.build_list([9])))
+
+        word, expected = list("instrumented"), list("instrumented")
+        self.originals["reverse-word-string", "reverse"](expected, 2, 9)
+        rws.reverse(word, 2, 9)
+        self.assertEqual(word, expected)
+        self.assertEqual(rws.reverse_words("  the sky  is blue "), "blue is sky the")
+
+        self.assertEqual(cmn.max_subsequence([9, 1, 2, 5, 8, 3], 3), [9, 8, 3])
+
+    def test_counters(self):
+        """Counters hold the work each hot loop did"""
+        cmn = load_solution("create-maximum-number")
+        gms = load_solution("get-maximum-score")
+        itl = load_solution("intersection-two-linked-lists")
+        rws = load_solution("reverse-word-string")
+        stats = self.enable()
+
+        cmn.max_subsequence([9, 1, 2, 5, 8, 3], 3)
+        gms.maxsum([1, 3, 5, 7, 9], [1, 2, 3, 4, 5])
+        common = itl.build_list([7])
+        head_a, head_b = itl.build_list([1, 2]), itl.build_list([3, 4, 5])
+        itl.connect_lists_at_node(head_a, common)
+        itl.connect_lists_at_node(head_b, common)
+        itl.get_intersection_node(head_a, head_b)
+        rws.reverse(list("abcde"), 0, 4)
+        # 6 = 6 is settled one digit in, 7 > 6 by the heads, then [6, 0, 4] is left
+        cmn.merge([6, 7], [6, 0, 4])
+        # 3 = 3 runs out with `b`: the longer `a` goes first, then 1 < 3
+        list(cmn.iter_merge([3, 1], [3]))
+
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot["max_subsequence"]["stack_pushes"], 6)
+        self.assertEqual(snapshot["max_subsequence"]["stack_pops"], 3)
+        self.assertEqual(snapshot["max_subsequence"]["calls"], 1)
+        self.assertEqual(snapshot["maxsum"]["pointer_steps"], 7)
+        self.assertEqual(snapshot["maxsum"]["shared_points"], 3)
+        # Prefixes of 2 and 3 nodes, 1 shared node, 1 step through None
+        self.assertEqual(snapshot["get_intersection_node"]["pointer_steps"], 7)
+        self.assertEqual(snapshot["reverse"]["swaps"], 2)
+        merge = snapshot["merge"]
+        self.assertEqual(merge["head_decisions"], 1)
+        self.assertEqual(merge["tie_peeks"], 1)
+        self.assertEqual(merge["peeked_digits"], 1)
+        self.assertEqual(merge["exhausted_ties"], 0)
+        self.assertEqual(merge["rank_decisions"], 0)
+        self.assertNotIn("suffix_rankings", merge)
+        iter_merge = snapshot["iter_merge"]
+        self.assertEqual(iter_merge["exhausted_ties"], 1)
+        self.assertEqual(iter_merge["head_decisions"], 1)
+        self.assertEqual(iter_merge["tie_peeks"], 0)
+        self.assertGreaterEqual(snapshot["maxsum"]["seconds"], 0)
+
+        with self.assertLogs("two_pointers.instrumentation", logging.INFO) as logs:
+            stats.log()
+        self.assertIn('"shared_points": 3', logs.output[0])
+
+        stats.reset()
+        self.assertEqual(stats.snapshot(), {})
+
+    def test_dispatched_maxsum_is_counted(self):
+        """The dispatcher's walk reports to the same counters as `maxsum`"""
+        with tempfile.TemporaryDirectory() as tmp:
+            # Every threshold unreached: the dispatcher walks in process
+            calibration = dispatch.Calibration(os.path.join(tmp, "calibration.json"))
+            for name in dispatch.PROBES:
+                calibration.put(name, None)
+            stats = self.enable()
+            result = dispatch.maxsum(
+                [1, 3, 5, 7, 9], (1, 2, 3, 4, 5), calibration=calibration
+            )
+
+        self.assertEqual(result, 31)
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot["maxsum"]["pointer_steps"], 7)
+        self.assertEqual(snapshot["maxsum"]["shared_points"], 3)
+
+    def test_suffix_rankings_labelled_by_caller(self):
+        """Rankings count under the merge that asked for them"""
+        cmn = load_solution("create-maximum-number")
+        a, b = [5, 5, 5, 1] * 3, [5, 5, 5, 2] * 3
+        expected = cmn.merge_reference(a, b)
+        stats = self.enable()
+
+        # No peeking: the first tie is settled by ranking
+        with mock.patch.object(cmn, "PEEK", 1):
+            self.assertEqual(cmn.merge(a, b), expected)
+            self.assertEqual(list(cmn.iter_merge(a, b)), expected)
+
+        snapshot = stats.snapshot()
+        for caller in ("merge", "iter_merge"):
+            self.assertEqual(snapshot[caller]["suffix_rankings"], 1, caller)
+            self.assertEqual(snapshot[caller]["ranked_digits"], len(a) + len(b))
+            self.assertEqual(snapshot[caller]["tie_peeks"], 0)
+            # Ranks decide every step until `b` runs out, `a` giving only 5, 5, 5
+            self.assertEqual(snapshot[caller]["rank_decisions"], len(b) + 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
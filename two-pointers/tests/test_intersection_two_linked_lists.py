@@ -0,0 +1,241 @@
+"""Unit tests for intersection-two-linked-lists/solution.py."""
+
+import os
+import random
+import tempfile
+import unittest
+from typing import List, Optional
+
+from two_pointers.intersection_two_linked_lists import (
+    build_list,
+    connect_lists_at_node,
+    get_common_intersection,
+    get_intersection_index,
+    get_intersection_node,
+    IntersectionIndex,
+    ListNode,
+    MappedNodePool,
+    NIL,
+    NodePool,
+    save_pool,
+)
+
+
+class TestIntersectionNode(unittest.TestCase):
+    """Unit tests for get_intersection_node function."""
+
+    def test_intersection_middle(self) -> None:
+        """
+        A: 1 -> 2 -> [8 -> 9]
+        B:       3 -> 4 ↗
+        """
+        common = build_list([8, 9])
+        head_a = build_list([1, 2])
+        head_b = build_list([3, 4])
+
+        # Attach A tail → common
+        cur = head_a
+        while cur.next:
+            cur = cur.next
+        cur.next = common
+
+        # Attach B tail → common
+        cur = head_b
+        while cur.next:
+            cur = cur.next
+        cur.next = common
+
+        self.assertIs(get_intersection_node(head_a, head_b), common)
+
+    def test_no_intersection(self) -> None:
+        """Lists do not intersect."""
+        head_a = build_list([1, 2, 3])
+        head_b = build_list([4, 5])
+        self.assertIsNone(get_intersection_node(head_a, head_b))
+
+    def test_intersection_at_head(self) -> None:
+        """A and B share the exact same head node."""
+        common = build_list([1, 2, 3])
+        head_a = head_b = common
+        self.assertIs(get_intersection_node(head_a, head_b), common)
+
+    def test_one_empty_list(self) -> None:
+        """One list is empty, the other is not."""
+        head_a = None
+        head_b = build_list([1, 2, 3])
+        self.assertIsNone(get_intersection_node(head_a, head_b))
+
+    def test_both_empty(self) -> None:
+        """Both lists are empty."""
+        self.assertIsNone(get_intersection_node(None, None))
+
+    def test_different_lengths_no_intersection(self) -> None:
+        """
+        A: 1 → 2 → 3 → 4 → 5
+        B: 9 → 8
+        No intersection. Algorithm should terminate normally.
+        """
+        head_a = build_list([1, 2, 3, 4, 5])
+        head_b = build_list([9, 8])
+        self.assertIsNone(get_intersection_node(head_a, head_b))
+
+
+class TestCommonIntersection(unittest.TestCase):
+    """Unit tests for get_common_intersection."""
+
+    def test_three_lists(self) -> None:
+        """
+        A: 1 -> [5 -> 6]
+        B: 2 -> 3 -> [4 -> 5 -> 6]
+        C:      7 -> [4 ...]
+        All three share node 5; B and C already meet at node 4.
+        """
+        shared = build_list([5, 6])
+        four = ListNode(4, shared)
+        head_a = ListNode(1, shared)
+        head_b = build_list([2, 3])
+        connect_lists_at_node(head_b, four)
+        head_c = ListNode(7, four)
+
+        heads = [head_a, head_b, head_c]
+        self.assertIs(get_common_intersection(heads), shared)
+        self.assertIs(get_common_intersection(heads, subset=[1, 2]), four)
+        self.assertIs(get_common_intersection(heads, subset=[0]), head_a)
+
+    def test_matches_pairwise(self) -> None:
+        """For two lists the result equals get_intersection_node."""
+        common = build_list([8, 9])
+        head_a, head_b = build_list([1, 2]), build_list([3, 4, 5])
+        connect_lists_at_node(head_a, common)
+        connect_lists_at_node(head_b, common)
+        for a, b in [(head_a, head_b), (head_a, common), (head_b, head_b)]:
+            self.assertIs(get_common_intersection([a, b]), get_intersection_node(a, b))
+
+    def test_no_common_node(self) -> None:
+        """Different tails, empty lists or no lists give None."""
+        self.assertIsNone(get_common_intersection([build_list([1]), build_list([1])]))
+        self.assertIsNone(get_common_intersection([build_list([1]), None]))
+        self.assertIsNone(get_common_intersection([]))
+
+
+class TestNodePool(unittest.TestCase):
+    """Unit tests for the array-backed NodePool and its intersection."""
+
+    def test_build_list(self) -> None:
+        """Nodes are laid out contiguously and terminated by NIL."""
+        pool = NodePool()
+        head = pool.build_list([1, 2, 3])
+        self.assertEqual(head, 0)
+        self.assertEqual(list(pool.vals), [1, 2, 3])
+        self.assertEqual(list(pool.nexts), [1, 2, NIL])
+        self.assertEqual(pool.build_list([]), NIL)
+
+    def test_intersection_middle(self) -> None:
+        """
+        A: 1 -> 2 -> [8 -> 9]
+        B:       3 -> 4 ↗
+        """
+        pool = NodePool()
+        common = pool.build_list([8, 9])
+        head_a = pool.build_list([1, 2])
+        head_b = pool.build_list([3, 4])
+        pool.connect_lists_at_node(head_a, common)
+        pool.connect_lists_at_node(head_b, common)
+        self.assertEqual(get_intersection_index(pool, head_a, head_b), common)
+        self.assertEqual(pool.vals[common], 8)
+
+    def test_no_intersection(self) -> None:
+        """Disjoint lists and empty lists give NIL."""
+        pool = NodePool()
+        head_a = pool.build_list([1, 2, 3, 4, 5])
+        head_b = pool.build_list([9, 8])
+        self.assertEqual(get_intersection_index(pool, head_a, head_b), NIL)
+        self.assertEqual(get_intersection_index(pool, NIL, head_b), NIL)
+        self.assertEqual(get_intersection_index(pool, NIL, NIL), NIL)
+
+    def test_intersection_at_head(self) -> None:
+        """Both heads are the same node."""
+        pool = NodePool()
+        head = pool.build_list([1, 2, 3])
+        self.assertEqual(get_intersection_index(pool, head, head), head)
+
+    def test_build_list_with_shared_suffix(self) -> None:
+        """build_list can point the new tail at an existing node."""
+        pool = NodePool()
+        common = pool.build_list([8, 9])
+        head_a = pool.build_list([1, 2], next_node=common)
+        head_b = pool.build_list([3], next_node=common)
+        self.assertEqual(get_intersection_index(pool, head_a, head_b), common)
+        self.assertEqual(pool.build_list([], next_node=common), common)
+
+    def test_save_and_map(self) -> None:
+        """A saved pool maps back with the same arrays and answers."""
+        pool = NodePool()
+        common = pool.build_list(range(100))
+        head_a = pool.build_list(range(7), next_node=common)
+        head_b = pool.build_list(range(3), next_node=common)
+        lone = pool.build_list([5, 6])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pool.bin")
+            save_pool(pool, path)
+            with MappedNodePool(path) as mapped:
+                self.assertEqual(len(mapped), len(pool))
+                self.assertEqual(list(mapped.vals), list(pool.vals))
+                self.assertEqual(list(mapped.nexts), list(pool.nexts))
+                self.assertEqual(get_intersection_index(mapped, head_a, head_b), common)
+                self.assertEqual(get_intersection_index(mapped, head_a, lone), NIL)
+
+    def test_map_rejects_other_files(self) -> None:
+        """Files without the NodePool header are refused."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "junk.bin")
+            with open(path, "wb") as f:
+                f.write(b"x" * 32)
+            with self.assertRaises(ValueError):
+                MappedNodePool(path)
+
+    def test_slotted_list_node(self) -> None:
+        """ListNode keeps its object API without a per-instance __dict__."""
+        node = ListNode(1, ListNode(2))
+        self.assertEqual(node.next.val, 2)
+        self.assertFalse(hasattr(node, "__dict__"))
+
+
+class TestIntersectionIndex(unittest.TestCase):
+    """Unit tests for the batch IntersectionIndex."""
+
+    def test_matches_pointer_switching(self) -> None:
+        """Every pair in a random forest agrees with get_intersection_node."""
+        rng = random.Random(0)
+        nodes: List[ListNode] = []
+        heads: List[Optional[ListNode]] = [None]
+
+        # Grow a forest: each new list ends in an existing node or in None
+        for _ in range(60):
+            tail = rng.choice(nodes) if nodes and rng.random() < 0.8 else None
+            head = build_list(rng.randint(1, 5) for _ in range(rng.randint(0, 6)))
+            if head is None:
+                head = tail
+            else:
+                connect_lists_at_node(head, tail)
+            cur = head
+            while cur is not None and cur not in nodes:
+                nodes.append(cur)
+                cur = cur.next
+            heads.append(head)
+
+        index = IntersectionIndex(heads)
+        pairs = [(a, b) for a in heads for b in heads]
+        for (a, b), got in zip(pairs, index.intersect_many(pairs)):
+            self.assertIs(got, get_intersection_node(a, b))
+
+    def test_unindexed_head(self) -> None:
+        """Heads must be added before they are queried."""
+        index = IntersectionIndex([build_list([1, 2])])
+        with self.assertRaises(KeyError):
+            index.intersect(build_list([3]), build_list([4]))
+
+
+if __name__ == "__main__":
+    unittest.main()
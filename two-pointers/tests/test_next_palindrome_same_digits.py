@@ -0,0 +1,258 @@
+"""Unit tests for next-palindrome-same-digits/solution.py."""
+
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+from two_pointers.next_palindrome_same_digits import (
+    _next_left_half,
+    _next_left_halves_numpy,
+    _permutation_rank,
+    find_next_palindrome,
+    find_next_palindrome_batch,
+    find_next_palindrome_bytes,
+    find_next_palindrome_reference,
+    iter_next_palindromes,
+    kth_next_palindrome,
+    LRUCache,
+    next_permutation,
+)
+
+
+class TestNextPermutation(unittest.TestCase):
+    """Unit tests for the next_permutation function."""
+
+    def test_simple_increase(self):
+        """Simple case: 123 -> 132"""
+        digits = [1, 2, 3]
+        result = next_permutation(digits)
+        self.assertTrue(result)
+        self.assertEqual(digits, [1, 3, 2])
+
+    def test_multiple_steps(self):
+        """Multiple steps: 132 -> 213"""
+        digits = [1, 3, 2]
+        result = next_permutation(digits)
+        self.assertTrue(result)
+        self.assertEqual(digits, [2, 1, 3])
+
+    def test_already_max(self):
+        """Already the largest permutation: 321 -> no next"""
+        digits = [3, 2, 1]
+        result = next_permutation(digits)
+        self.assertFalse(result)
+        self.assertEqual(digits, [3, 2, 1])
+
+    def test_all_equal(self):
+        """All digits equal: 111 -> no next"""
+        digits = [1, 1, 1]
+        result = next_permutation(digits)
+        self.assertFalse(result)
+        self.assertEqual(digits, [1, 1, 1])
+
+    def test_in_place_behavior(self):
+        """Check that the input list is modified in-place."""
+        digits = [1, 2, 3]
+        ref = digits
+        next_permutation(digits)
+        self.assertIs(digits, ref)  # same object, modified in-place
+
+
+class TestFindNextPalindrome(unittest.TestCase):
+    """Unit tests for the find_next_palindrome function."""
+
+    def test_example_from_statement(self):
+        """Example given in the problem statement."""
+        self.assertEqual(find_next_palindrome("123321"), "132231")
+
+    def test_even_length(self):
+        """Even length case: 1221 -> 2112"""
+        self.assertEqual(find_next_palindrome("1221"), "2112")
+
+    def test_odd_length(self):
+        """Odd length case: 12321 -> 21312"""
+        self.assertEqual(find_next_palindrome("12321"), "21312")
+
+    def test_all_digits_equal(self):
+        """All digits equal: 111111 -> no next"""
+        self.assertEqual(find_next_palindrome("111111"), "")
+        self.assertEqual(find_next_palindrome("999999"), "")
+
+    def test_single_digit(self):
+        """Single digit case: no next palindrome"""
+        self.assertEqual(find_next_palindrome("1"), "")
+        self.assertEqual(find_next_palindrome("9"), "")
+
+    def test_already_largest(self):
+        """Input already yields the lexicographically largest
+        palindrome from these digits -> no next palindrome"""
+        self.assertEqual(find_next_palindrome("543345"), "")
+
+    def test_typical_even_case(self):
+        """Typical even-length case: 889988 -> 898898"""
+        self.assertEqual(find_next_palindrome("889988"), "898898")
+
+    def test_other_valid_case(self):
+        """Another valid case: 455554 -> 545545"""
+        self.assertEqual(find_next_palindrome("455554"), "545545")
+
+    def test_result_is_palindrome(self):
+        """Ensure the result (when non-empty) is actually a palindrome"""
+        s = "123321"
+        result = find_next_palindrome(s)
+        self.assertNotEqual(result, "")  # sanity: should exist
+        self.assertEqual(result, result[::-1])  # must be palindrome
+
+    def test_result_is_strictly_greater(self):
+        """ "Ensure the result (when non-empty) is strictly greater than input"""
+        s = "123321"
+        result = find_next_palindrome(s)
+        self.assertGreater(result, s)
+
+    def test_same_digits_multiset(self):
+        """Ensure the result (if any) uses exactly the same multiset of digits"""
+        for s in ["123321", "1221", "12321", "889988", "455554"]:
+            result = find_next_palindrome(s)
+            if result:
+                self.assertEqual(sorted(s), sorted(result))
+
+
+class TestFindNextPalindromeBytes(unittest.TestCase):
+    """Unit tests for the byte-level find_next_palindrome fast path."""
+
+    def test_buffer_types(self):
+        """bytes, bytearray and memoryview inputs are all accepted"""
+        for data in (b"123321", bytearray(b"123321"), memoryview(b"123321")):
+            self.assertEqual(find_next_palindrome_bytes(data), b"132231")
+
+    def test_matches_reference(self):
+        """Random palindromes agree with the digit-list reference"""
+        rng = random.Random(0)
+        for _ in range(2000):
+            alphabet = "0123456789"[: rng.randint(1, 10)]
+            left = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            middle = rng.choice(["", "5"])
+            s = left + middle + left[::-1]
+            self.assertEqual(find_next_palindrome(s), find_next_palindrome_reference(s))
+
+    def test_non_digits_rejected(self):
+        """Non-digit input is rejected like int() would, in either half"""
+        for s in ("1a1", "12ab", "ab12", "1 21", "12\n21"):
+            with self.assertRaises(ValueError):
+                find_next_palindrome(s)
+            with self.assertRaises(ValueError):
+                find_next_palindrome_bytes(memoryview(s.encode()))
+            with self.assertRaises(ValueError):
+                next(iter_next_palindromes(s))
+            with self.assertRaises(ValueError):
+                find_next_palindrome_batch([s], LRUCache())
+
+    def test_non_ascii_digits(self):
+        """Other Unicode digits give the reference's answer, as int() reads them"""
+        for s in ("١٢٢١", "١٢٣٢١", "٤٣٣٤"):
+            expected = find_next_palindrome_reference(s)
+            self.assertEqual(find_next_palindrome(s), expected)
+            self.assertEqual(find_next_palindrome_batch([s], LRUCache()), [expected])
+        self.assertEqual(find_next_palindrome("١٢٢١"), "2112")
+        with self.assertRaises(ValueError):
+            find_next_palindrome("1é1")
+
+
+class TestIterNextPalindromes(unittest.TestCase):
+    """Unit tests for the iter_next_palindromes generator."""
+
+    def test_enumerates_all_in_order(self):
+        """All palindromes after the seed, each equal to chained calls"""
+        s = "1122332211"
+        expected = []
+        while True:
+            s = find_next_palindrome(s)
+            if not s:
+                break
+            expected.append(s)
+        self.assertEqual(list(iter_next_palindromes("1122332211")), expected)
+        self.assertEqual(expected, sorted(expected))
+
+    def test_reuse_buffer(self):
+        """With reuse_buffer the same bytearray is updated in place"""
+        seen = [
+            (id(buf), bytes(buf))
+            for buf in iter_next_palindromes("12321", reuse_buffer=True)
+        ]
+        self.assertEqual(len({ident for ident, _ in seen}), 1)
+        self.assertEqual([value for _, value in seen], [b"21312"])
+
+    def test_no_successor(self):
+        """Highest arrangement or single digit yields nothing"""
+        self.assertEqual(list(iter_next_palindromes("543345")), [])
+        self.assertEqual(list(iter_next_palindromes("7")), [])
+
+
+class TestKthNextPalindrome(unittest.TestCase):
+    """Unit tests for kth_next_palindrome."""
+
+    def test_matches_iteration(self):
+        """Every k agrees with stepping through iter_next_palindromes"""
+        for s in ["1122332211", "12321", "889988", "1230321"]:
+            following = list(iter_next_palindromes(s))
+            for k, expected in enumerate(following, 1):
+                self.assertEqual(kth_next_palindrome(s, k), expected)
+            self.assertEqual(kth_next_palindrome(s, len(following) + 1), "")
+            self.assertEqual(kth_next_palindrome(s, 0), s)
+
+    def test_first_step_is_next_palindrome(self):
+        """k = 1 is find_next_palindrome, including the empty results"""
+        for s in ["123321", "1221", "543345", "111111", "9", ""]:
+            self.assertEqual(kth_next_palindrome(s, 1), find_next_palindrome(s))
+
+    def test_huge_jump(self):
+        """A jump of 10**12 lands on the palindrome with that rank"""
+        left = "0123456789" * 3
+        s = left + left[::-1]
+        target = kth_next_palindrome(s, 10**12)
+        self.assertEqual(target, target[::-1])
+        self.assertEqual(sorted(target), sorted(s))
+        rank = _permutation_rank(target[:30].encode())
+        self.assertEqual(rank - _permutation_rank(left.encode()), 10**12)
+
+
+class TestFindNextPalindromeBatch(unittest.TestCase):
+    """Unit tests for the batched, cached palindrome service."""
+
+    def test_matches_single_calls(self):
+        """Batch results equal find_next_palindrome, in input order"""
+        rng = random.Random(1)
+        strings = ["123321", "1221", "12321", "543345", "1", "", "889988"]
+        for _ in range(500):
+            left = "".join(rng.choice("1234") for _ in range(rng.randint(0, 4)))
+            strings.append(left + rng.choice(["", "7"]) + left[::-1])
+        cache = LRUCache()
+        expected = [find_next_palindrome(s) for s in strings]
+        self.assertEqual(find_next_palindrome_batch(strings, cache), expected)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_group(self):
+        """The vectorized engine agrees with next_permutation row by row"""
+        rng = random.Random(2)
+        lefts = list({bytes(rng.choice(b"0123") for _ in range(6)) for _ in range(300)})
+        self.assertEqual(
+            _next_left_halves_numpy(lefts), [_next_left_half(x) for x in lefts]
+        )
+
+    def test_cache_counters_and_bound(self):
+        """Repeated left halves hit the cache; the cache stays bounded"""
+        cache = LRUCache(maxsize=2)
+        find_next_palindrome_batch(["1221", "1221", "12321"], cache)
+        self.assertEqual(cache.info()["misses"], 1)  # one distinct left half
+        find_next_palindrome_batch(["1221"], cache)
+        self.assertEqual(cache.info()["hits"], 1)
+        find_next_palindrome_batch(["3443", "5665", "7887"], cache)
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
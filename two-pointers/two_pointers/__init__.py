@@ -0,0 +1,119 @@
+"""Importable facade over the two-pointers solvers.
+
+The solvers live in hyphenated directories (``get-maximum-score/solution.py``
+and so on) that cannot be imported by name. This package exposes each of
+them as a submodule, and every public solver as a package attribute, loading
+a solution file only when one of its names is first used::
+
+    from two_pointers import maxsum_multi                # loads get-maximum-score
+    from two_pointers import create_maximum_number       # loads that module
+    import two_pointers.reverse_word_string
+
+`maxsum`, `max_number`, `find_next_palindrome` and `reverse_words` resolve to
+the size- and type-based dispatchers of `two_pointers.dispatch`, which pick
+the pure-Python, NumPy or process-pool engine per call; the solver functions
+themselves stay reachable through their submodules. Opt-in counters and
+timers for the hot loops live in `two_pointers.instrumentation`.
+
+Importing the package itself loads no solver.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+from types import ModuleType
+from typing import Dict, List
+
+# Directory holding the hyphenated problem directories
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Submodule name -> problem directory
+PROBLEMS: Dict[str, str] = {
+    "create_maximum_number": "create-maximum-number",
+    "get_maximum_score": "get-maximum-score",
+    "intersection_two_linked_lists": "intersection-two-linked-lists",
+    "next_palindrome_same_digits": "next-palindrome-same-digits",
+    "reverse_word_string": "reverse-word-string",
+}
+
+# Public solver name -> submodule defining it
+EXPORTS: Dict[str, str] = {
+    # create-maximum-number
+    "max_subsequence": "create_maximum_number",
+    "max_subsequences_all": "create_maximum_number",
+    "merge": "create_maximum_number",
+    "iter_merge": "create_maximum_number",
+    "max_number": "dispatch",
+    "MaxSubsequenceStream": "create_maximum_number",
+    "max_number_batch": "create_maximum_number",
+    # get-maximum-score
+    "maxsum": "dispatch",
+    "maxsum_numpy": "get_maximum_score",
+    "maxsum_chunked": "get_maximum_score",
+    "maxsum_parallel": "get_maximum_score",
+    "maxsum_multi": "get_maximum_score",
+    "MaxScoreIndex": "get_maximum_score",
+    # intersection-two-linked-lists
+    "ListNode": "intersection_two_linked_lists",
+    "build_list": "intersection_two_linked_lists",
+    "connect_lists_at_node": "intersection_two_linked_lists",
+    "get_intersection_node": "intersection_two_linked_lists",
+    "get_common_intersection": "intersection_two_linked_lists",
+    "NodePool": "intersection_two_linked_lists",
+    "save_pool": "intersection_two_linked_lists",
+    "MappedNodePool": "intersection_two_linked_lists",
+    "get_intersection_index": "intersection_two_linked_lists",
+    "IntersectionIndex": "intersection_two_linked_lists",
+    # next-palindrome-same-digits
+    "next_permutation": "next_palindrome_same_digits",
+    "find_next_palindrome": "dispatch",
+    "find_next_palindrome_bytes": "next_palindrome_same_digits",
+    "iter_next_palindromes": "next_palindrome_same_digits",
+    "kth_next_palindrome": "next_palindrome_same_digits",
+    "find_next_palindrome_batch": "next_palindrome_same_digits",
+    # reverse-word-string
+    "reverse_words": "dispatch",
+    "reverse_words_bytes": "reverse_word_string",
+    "reverse_words_file": "reverse_word_string",
+    "reverse_words_lines_parallel": "reverse_word_string",
+}
+
+__all__ = ["dispatch", "instrumentation", "load_solution", *PROBLEMS, *EXPORTS]
+
+
+class _SolutionFinder:
+    """
+    Meta path finder resolving ``two_pointers.<name>`` to
+    ``<problem>/solution.py`` (kept off importlib.abc, which is slow to import).
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        package, _, name = fullname.rpartition(".")
+        if package != __name__ or name not in PROBLEMS:
+            return None
+        location = os.path.join(ROOT, PROBLEMS[name], "solution.py")
+        return importlib.util.spec_from_file_location(fullname, location)
+
+
+# Lets `import two_pointers.x` work, including in spawned worker processes
+sys.meta_path.append(_SolutionFinder())
+
+
+def load_solution(problem: str) -> ModuleType:
+    """Return the solver module of a problem directory, e.g. "get-maximum-score"."""
+    return importlib.import_module(f"{__name__}.{problem.replace('-', '_')}")
+
+
+def __getattr__(name: str):
+    if name in PROBLEMS or name in ("dispatch", "instrumentation"):
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in EXPORTS:
+        value = getattr(importlib.import_module(f"{__name__}.{EXPORTS[name]}"), name)
+        globals()[name] = value  # later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
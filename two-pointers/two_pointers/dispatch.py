@@ -0,0 +1,450 @@
+"""
+Engine dispatch by input size and type.
+
+The solvers ship a low-overhead pure-Python path next to vectorized (NumPy)
+and parallel (process pool) engines, and which one is fastest depends on
+the input size and on the host. The functions here take the same arguments
+as the solvers and pick the engine per call:
+
+    from two_pointers import dispatch
+
+    dispatch.maxsum(nums1, nums2)         # walk, NumPy or process pool
+    dispatch.max_number(nums1, nums2, k)  # in-process or process pool
+    dispatch.find_next_palindrome(strs)   # one string, bytes, or a batch
+    dispatch.reverse_words(sentence)      # str loop or bytes engine
+
+Each crossover point is measured by a short calibration run the first time
+it is needed, then cached in a JSON file (per host, so a shared home
+directory keeps one entry per machine). `python -m two_pointers.dispatch`
+prints the thresholds of this host; `--recalibrate` measures them again.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from . import load_solution
+
+# Wall-clock seconds one threshold's calibration may take
+DEFAULT_BUDGET = 1.0
+
+# Whitespace `reverse_words` keeps inside words but `reverse_words_bytes`
+# splits on (str.strip also strips \x1c-\x1f)
+_BYTES_UNSAFE = re.compile(r"[\t\n\r\x0b\x0c\x1c-\x1f]")
+
+
+def default_path() -> str:
+    """$TWO_POINTERS_CALIBRATION, else calibration.json in the user cache dir."""
+    path = os.environ.get("TWO_POINTERS_CALIBRATION")
+    if path:
+        return path
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache, "two_pointers", "calibration.json")
+
+
+def host_key() -> str:
+    """What the thresholds depend on: machine, interpreter, CPUs and NumPy."""
+    numpy = "numpy" if importlib.util.find_spec("numpy") else "no-numpy"
+    return "/".join(
+        [
+            platform.node(),
+            platform.machine(),
+            f"{platform.python_implementation()}-{platform.python_version()}",
+            f"cpus={os.cpu_count() or 1}",
+            numpy,
+        ]
+    )
+
+
+# ------------------------------------------------------------
+# Calibration probes
+# ------------------------------------------------------------
+class Probe(NamedTuple):
+    """
+    How one threshold is measured.
+
+    `make(n, rng)` builds the arguments for size `n` (in the unit the
+    dispatcher compares against the threshold); `slow` is the engine used
+    below the threshold and `fast` the one used from it on. Probes that are
+    not `available` on this host (no NumPy, a single CPU) record None,
+    meaning the fast engine is never used.
+    """
+
+    sizes: Sequence[int]
+    make: Callable[[int, random.Random], tuple]
+    slow: Callable[..., Any]
+    fast: Callable[..., Any]
+    available: Callable[[], bool] = lambda: True
+
+
+def _has_numpy() -> bool:
+    return load_solution("get-maximum-score")._numpy() is not None
+
+
+def _has_cpus() -> bool:
+    return (os.cpu_count() or 1) > 1
+
+
+def _sorted_pair(n, rng):
+    """Two increasing arrays of n // 2 elements each, about 10% shared."""
+    shared = set(rng.sample(range(4 * n), n // 20))
+    nums1 = sorted(shared | set(rng.sample(range(4 * n), n // 2 - len(shared))))
+    nums2 = sorted(shared | set(rng.sample(range(4 * n), n // 2 - len(shared))))
+    return nums1[: n // 2], nums2[: n // 2]
+
+
+def _digit_pair(work, rng):
+    """Two digit arrays of s digits and k = s, so splits * k is about `work`."""
+    s = max(1, int(work**0.5))
+    nums1 = [rng.randrange(10) for _ in range(s)]
+    nums2 = [rng.randrange(10) for _ in range(s)]
+    return nums1, nums2, s
+
+
+def _palindromes(count, rng):
+    """`count` random 12-digit palindromes."""
+    lefts = ["".join(rng.choices("0123456789", k=6)) for _ in range(count)]
+    return ([left + left[::-1] for left in lefts],)
+
+
+def _sentence(length, rng):
+    """About `length` characters of ASCII words separated by space runs."""
+    parts, total = [], 0
+    while total < length:
+        part = "x" * rng.randint(1, 8) + " " * rng.randint(1, 3)
+        parts.append(part)
+        total += len(part)
+    return ("".join(parts)[:length],)
+
+
+def _maxsum_in_process(nums1, nums2):
+    """The fastest in-process engine at the sizes the pool is tried at."""
+    mod = load_solution("get-maximum-score")
+    if mod._numpy() is not None:
+        return mod.maxsum_numpy(nums1, nums2)
+    return mod._maxsum_walk(nums1, nums2)
+
+
+def _loop_next_palindrome(strings):
+    mod = load_solution("next-palindrome-same-digits")
+    return [mod.find_next_palindrome(s) for s in strings]
+
+
+def _batch_next_palindrome(strings):
+    # A private cache, so calibration neither helps nor pollutes BATCH_CACHE
+    mod = load_solution("next-palindrome-same-digits")
+    return mod.find_next_palindrome_batch(strings, mod.LRUCache())
+
+
+PROBES: Dict[str, Probe] = {
+    # Combined input length from which maxsum_numpy beats the walk
+    "maxsum.numpy": Probe(
+        [1 << p for p in range(6, 21, 2)],
+        _sorted_pair,
+        lambda a, b: load_solution("get-maximum-score")._maxsum_walk(a, b),
+        lambda a, b: load_solution("get-maximum-score").maxsum_numpy(a, b),
+        _has_numpy,
+    ),
+    # Combined input length from which the process pool beats both
+    "maxsum.parallel": Probe(
+        [1 << p for p in range(14, 23, 2)],
+        _sorted_pair,
+        _maxsum_in_process,
+        lambda a, b: load_solution("get-maximum-score").maxsum_parallel(
+            a, b, workers=os.cpu_count()
+        ),
+        _has_cpus,
+    ),
+    # Splits times k from which max_number's process pool pays off
+    "max_number.parallel": Probe(
+        [1 << p for p in range(8, 23, 2)],
+        _digit_pair,
+        lambda a, b, k: load_solution("create-maximum-number").max_number(a, b, k),
+        lambda a, b, k: load_solution("create-maximum-number").max_number(
+            a, b, k, workers=os.cpu_count()
+        ),
+        _has_cpus,
+    ),
+    # Number of strings from which find_next_palindrome_batch beats a loop
+    "find_next_palindrome.batch": Probe(
+        [1 << p for p in range(2, 17, 2)],
+        _palindromes,
+        _loop_next_palindrome,
+        _batch_next_palindrome,
+    ),
+    # Sentence length from which the bytes engine beats the str loop
+    "reverse_words.bytes": Probe(
+        [1 << p for p in range(4, 21, 2)],
+        _sentence,
+        lambda s: load_solution("reverse-word-string").reverse_words(s),
+        lambda s: load_solution("reverse-word-string")
+        .reverse_words_bytes(s.encode("ascii"))
+        .decode("ascii"),
+    ),
+}
+
+
+def _best_time(fn: Callable[..., Any], args: tuple) -> float:
+    """Best wall time of `fn(*args)`, repeating only the cheap runs."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+        if best > 0.02:
+            break
+    return best
+
+
+def measure(
+    probe: Probe, budget: float = DEFAULT_BUDGET, seed: int = 0
+) -> Optional[int]:
+    """
+    Smallest size of `probe.sizes` from which the fast engine wins.
+
+    A win only counts if it holds at the next size too, so one noisy
+    timing cannot set a threshold. Sizes grow 4x per step, and the next
+    step is skipped once it would likely overrun `budget` seconds; a win
+    at the last size measured is then taken as is. Returns None if the
+    fast engine did not win.
+    """
+    if not probe.available():
+        return None
+
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    candidate = None
+    for n in probe.sizes:
+        step = time.perf_counter()
+        args = probe.make(n, rng)
+        if _best_time(probe.fast, args) < _best_time(probe.slow, args):
+            if candidate is not None:
+                return candidate
+            candidate = n
+        else:
+            candidate = None
+        now = time.perf_counter()
+        if (now - start) + 4 * (now - step) > budget:
+            break
+    return candidate
+
+
+class Calibration:
+    """
+    Crossover thresholds of this host, keyed by probe name.
+
+    A threshold is measured on first `get` and written to the JSON cache at
+    `path` under `host_key()`; entries of other hosts are kept. A missing,
+    unreadable or unwritable cache only costs a re-measurement.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, budget: float = DEFAULT_BUDGET
+    ) -> None:
+        self.path = path or default_path()
+        self.budget = budget
+        self._thresholds: Optional[Dict[str, Optional[int]]] = None
+
+    def get(self, name: str) -> Optional[int]:
+        """Threshold `name`, measuring (and caching) it if needed."""
+        thresholds = self._load()
+        if name not in thresholds:
+            if name not in PROBES:
+                raise KeyError(f"unknown threshold {name!r}")
+            thresholds[name] = measure(PROBES[name], self.budget)
+            self._save()
+        return thresholds[name]
+
+    def put(self, name: str, value: Optional[int]) -> None:
+        """Override threshold `name` (None: never use the fast engine)."""
+        self._load()[name] = value
+        self._save()
+
+    def calibrate(
+        self, names: Optional[Iterable[str]] = None
+    ) -> Dict[str, Optional[int]]:
+        """Measure the given thresholds (all by default) again."""
+        thresholds = self._load()
+        for name in PROBES if names is None else names:
+            thresholds.pop(name, None)
+            self.get(name)
+        return dict(thresholds)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _load(self) -> Dict[str, Optional[int]]:
+        if self._thresholds is None:
+            self._thresholds = dict(self._read().get(host_key(), {}))
+        return self._thresholds
+
+    def _save(self) -> None:
+        data = self._read()
+        data[host_key()] = self._thresholds
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)  # readers never see a partial file
+        except OSError:
+            pass
+
+
+# Shared calibration used when a dispatcher gets no explicit one
+CALIBRATION = Calibration()
+
+
+def _reached(calibration: Calibration, name: str, size: int) -> bool:
+    threshold = calibration.get(name)
+    return threshold is not None and size >= threshold
+
+
+# ------------------------------------------------------------
+# Dispatchers
+# ------------------------------------------------------------
+def _maxsum_local(nums1, nums2, calibration: Calibration) -> int:
+    """`maxsum` of two lists or tuples without the process pool."""
+    mod = load_solution("get-maximum-score")
+    if _reached(calibration, "maxsum.numpy", len(nums1) + len(nums2)):
+        result = mod.maxsum_numpy(nums1, nums2)
+        if result is not None:
+            return result
+    return mod._maxsum_walk(nums1, nums2)
+
+
+def maxsum(
+    nums1,
+    nums2,
+    chunk_size: Optional[int] = None,
+    calibration: Optional[Calibration] = None,
+) -> int:
+    """
+    `maxsum` on the fastest engine for the input.
+
+    Lists and tuples are walked in Python, handed to `maxsum_numpy` or to
+    `maxsum_parallel` depending on their combined length. Any other input
+    (NumPy arrays, iterators, buffers) goes to the solver's own `maxsum`,
+    which already routes it by type.
+    """
+    calibration = calibration or CALIBRATION
+    mod = load_solution("get-maximum-score")
+
+    if not (isinstance(nums1, (list, tuple)) and isinstance(nums2, (list, tuple))):
+        return mod.maxsum(nums1, nums2, chunk_size or mod.CHUNK_SIZE)
+
+    if _reached(calibration, "maxsum.parallel", len(nums1) + len(nums2)):
+        try:
+            return mod.maxsum_parallel(nums1, nums2, workers=os.cpu_count())
+        except OverflowError:  # values beyond int64 cannot be shared
+            pass
+    return _maxsum_local(nums1, nums2, calibration)
+
+
+def max_number(
+    nums1: List[int],
+    nums2: List[int],
+    k: int,
+    workers: Optional[int] = None,
+    calibration: Optional[Calibration] = None,
+) -> List[int]:
+    """
+    `max_number`, searching the splits in a process pool when there are
+    enough of them. The work is measured as splits times k; an explicit
+    `workers` is passed through unchanged.
+    """
+    mod = load_solution("create-maximum-number")
+    if workers is None:
+        splits = max(0, min(k, len(nums1)) - max(0, k - len(nums2)) + 1)
+        if _reached(calibration or CALIBRATION, "max_number.parallel", splits * k):
+            workers = os.cpu_count()
+    return mod.max_number(nums1, nums2, k, workers=workers)
+
+
+def find_next_palindrome(num_str, calibration: Optional[Calibration] = None):
+    """
+    `find_next_palindrome` for a str, bytes-like object or batch of strings.
+
+    A str returns a str and bytes-like input returns bytes (through
+    `find_next_palindrome_bytes`). Any other iterable of strings returns
+    a list, built with `find_next_palindrome_batch` from the calibrated
+    batch size on and one string at a time below it.
+    """
+    mod = load_solution("next-palindrome-same-digits")
+    if isinstance(num_str, str):
+        return mod.find_next_palindrome(num_str)
+    if isinstance(num_str, (bytes, bytearray, memoryview)):
+        return mod.find_next_palindrome_bytes(num_str)
+
+    strings = list(num_str)
+    if _reached(calibration or CALIBRATION, "find_next_palindrome.batch", len(strings)):
+        return mod.find_next_palindrome_batch(strings)
+    return [mod.find_next_palindrome(s) for s in strings]
+
+
+def reverse_words(sentence, calibration: Optional[Calibration] = None):
+    """
+    `reverse_words` for a str or bytes-like sentence.
+
+    Bytes-like input goes to `reverse_words_bytes`. A long str is encoded
+    and goes there too, as long as both engines split it the same way: it
+    must be ASCII with no whitespace other than spaces. Everything else
+    runs the pure-Python `reverse_words`.
+    """
+    mod = load_solution("reverse-word-string")
+    if isinstance(sentence, (bytes, bytearray, memoryview)):
+        return mod.reverse_words_bytes(sentence)
+
+    if (
+        _reached(calibration or CALIBRATION, "reverse_words.bytes", len(sentence))
+        and sentence.isascii()
+        and not _BYTES_UNSAFE.search(sentence)
+    ):
+        return mod.reverse_words_bytes(sentence.encode("ascii")).decode("ascii")
+    return mod.reverse_words(sentence)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m two_pointers.dispatch", description=__doc__
+    )
+    parser.add_argument("--recalibrate", action="store_true", help="measure again")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET)
+    args = parser.parse_args(argv)
+
+    calibration = Calibration(budget=args.budget)
+    if args.recalibrate:
+        thresholds = calibration.calibrate()
+    else:
+        thresholds = {name: calibration.get(name) for name in PROBES}
+
+    print(f"# {host_key()} ({calibration.path})")
+    print(json.dumps(thresholds, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""Opt-in hot-path instrumentation for the two-pointers solvers.
+
+Nothing here runs unless `enable()` is called: the solver modules keep their
+plain functions, and the hot loops carry no checks. `enable()` swaps
+instrumented variants (counting copies of the hot loops, and timing
+wrappers) into the solver modules; `disable()` puts the originals back.
+
+    from two_pointers import instrumentation
+
+    stats = instrumentation.enable()
+    ...                       # run solvers
+    stats.snapshot()          # {"merge": {"calls": 3, "seconds": ...}, ...}
+    stats.log()               # one JSON line through `logging`
+    instrumentation.disable()
+
+Only lookups through the module are affected: solvers calling each other
+(e.g. `max_number` -> `iter_merge`) are counted, but a function imported by
+name before `enable()` keeps pointing at the original.
+"""
+
+import functools
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import load_solution
+
+logger = logging.getLogger(__name__)
+
+
+class Stats:
+    """Per-function counters and timers, as filled by the instrumented variants."""
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(int))
+
+    def add(self, function: str, counter: str, amount: float = 1) -> None:
+        self._data[function][counter] += amount
+
+    def reset(self) -> None:
+        self._data.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Current values as a plain dict, for scraping."""
+        return {name: dict(counters) for name, counters in self._data.items()}
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), sort_keys=True)
+
+    def log(self, level: int = logging.INFO) -> None:
+        """Log the snapshot as one JSON line."""
+        logger.log(level, "%s", self.to_json())
+
+
+def _timed(stats: Stats, name: str, fn: Callable) -> Callable:
+    """Wrap `fn` to count calls and accumulate wall time under `name`."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            stats.add(name, "calls")
+            stats.add(name, "seconds", time.perf_counter() - start)
+
+    return wrapper
+
+
+# ------------------------------------------------------------
+# Instrumented variants of the hot loops
+# ------------------------------------------------------------
+def _merge_steps(stats: Stats, mod, name: str, a, b):
+    """
+    The loop of `iter_merge`, counting under `name` how each step was decided:
+    by different heads, by peeking into a tie (and how far), by a suffix
+    running out, or by suffix ranks (and how many digits were ranked).
+    """
+    i = j = 0
+    n, m = len(a), len(b)
+    heads = peeks = peeked = exhausted = ranked = 0
+    try:
+        while i < n and j < m:
+            x, y = a[i], b[j]
+            if x != y:
+                heads += 1
+                take_a = x > y
+            else:
+                d, limit = 1, min(n - i, m - j, mod.PEEK)
+                while d < limit and a[i + d] == b[j + d]:
+                    d += 1
+                peeked += d
+                if d < limit:
+                    peeks += 1
+                    take_a = a[i + d] > b[j + d]
+                elif d == n - i or d == m - j:
+                    exhausted += 1
+                    take_a = n - i > m - j
+                else:
+                    break
+
+            if take_a:
+                yield x
+                i += 1
+            else:
+                yield y
+                j += 1
+
+        if i < n and j < m:
+            stats.add(name, "suffix_rankings")
+            stats.add(name, "ranked_digits", n - i + m - j)
+            rank = mod._suffix_ranks(a[i:], b[j:])
+            offset = n - i + 1 - j
+            base = i
+            while i < n and j < m:
+                ranked += 1
+                if rank[i - base] > rank[offset + j]:
+                    yield a[i]
+                    i += 1
+                else:
+                    yield b[j]
+                    j += 1
+
+        yield from a[i:]
+        yield from b[j:]
+    finally:
+        # Also runs when a caller abandons the merge early
+        stats.add(name, "head_decisions", heads)
+        stats.add(name, "tie_peeks", peeks)
+        stats.add(name, "peeked_digits", peeked)
+        stats.add(name, "exhausted_ties", exhausted)
+        stats.add(name, "rank_decisions", ranked)
+
+
+def _merge(stats: Stats, mod) -> Callable:
+    original = mod.merge
+
+    @functools.wraps(original)
+    def merge(a, b):
+        return list(_merge_steps(stats, mod, "merge", a, b))
+
+    return merge
+
+
+def _iter_merge(stats: Stats, mod) -> Callable:
+    original = mod.iter_merge
+
+    @functools.wraps(original)
+    def iter_merge(a, b):
+        return _merge_steps(stats, mod, "iter_merge", a, b)
+
+    return iter_merge
+
+
+def _max_subsequence_upgrade(stats: Stats, mod) -> Callable:
+    def _max_subsequence_upgrade(nums, k):
+        if k <= 0:
+            return []
+        if k >= len(nums):
+            return nums[:]
+
+        sub = nums[:k]
+        for digit in nums[k:]:
+            best = sub[:]
+            for j in range(k):
+                cand = sub[:j] + sub[j + 1 :] + [digit]
+                stats.add("max_subsequence", "candidate_lists")
+                if cand > best:
+                    best = cand[:]
+            sub = best
+        return sub
+
+    return _max_subsequence_upgrade
+
+
+def _max_subsequence_stack(stats: Stats, mod) -> Callable:
+    def _max_subsequence_stack(nums, k):
+        if k <= 0:
+            return []
+        if k >= len(nums):
+            return nums[:]
+
+        drop = len(nums) - k
+        stack = []
+        for digit in nums:
+            while drop and stack and stack[-1] < digit:
+                stack.pop()
+                drop -= 1
+            stack.append(digit)
+
+        stats.add("max_subsequence", "stack_pushes", len(nums))
+        stats.add("max_subsequence", "stack_pops", len(nums) - k - drop)
+        return stack[:k]
+
+    return _max_subsequence_stack
+
+
+def _maxsum_walk(stats: Stats, mod) -> Callable:
+    # Counted under "maxsum": `maxsum` and the dispatcher both end up here
+    def _maxsum_walk(nums1, nums2):
+        i = j = 0
+        n, m = len(nums1), len(nums2)
+        sum1 = sum2 = total = 0
+        steps = shared = 0
+
+        while i < n or j < m:
+            steps += 1
+            if j == m or (i < n and nums1[i] < nums2[j]):
+                sum1 += nums1[i]
+                i += 1
+            elif i == n or nums2[j] < nums1[i]:
+                sum2 += nums2[j]
+                j += 1
+            else:
+                shared += 1
+                total += max(sum1, sum2) + nums1[i]
+                sum1 = sum2 = 0
+                i += 1
+                j += 1
+
+        stats.add("maxsum", "pointer_steps", steps)
+        stats.add("maxsum", "shared_points", shared)
+        return (total + max(sum1, sum2)) % mod.MOD
+
+    return _maxsum_walk
+
+
+def _get_intersection_node(stats: Stats, mod) -> Callable:
+    def get_intersection_node(head_a, head_b):
+        ptr_a, ptr_b = head_a, head_b
+        steps = 0
+        while ptr_a is not ptr_b:
+            steps += 1
+            ptr_a = head_b if ptr_a is None else ptr_a.next
+            ptr_b = head_a if ptr_b is None else ptr_b.next
+        stats.add("get_intersection_node", "pointer_steps", steps)
+        return ptr_a
+
+    return get_intersection_node
+
+
+def _reverse(stats: Stats, mod) -> Callable:
+    def reverse(word, left, right):
+        swaps = 0
+        while left < right:
+            word[left], word[right] = word[right], word[left]
+            left += 1
+            right -= 1
+            swaps += 1
+        stats.add("reverse", "swaps", swaps)
+
+    return reverse
+
+
+# (problem, attribute) -> factory building the instrumented replacement
+VARIANTS: Dict[Tuple[str, str], Callable[[Stats, Any], Callable]] = {
+    ("create-maximum-number", "merge"): _merge,
+    ("create-maximum-number", "iter_merge"): _iter_merge,
+    ("create-maximum-number", "_max_subsequence_upgrade"): _max_subsequence_upgrade,
+    ("create-maximum-number", "_max_subsequence_stack"): _max_subsequence_stack,
+    ("get-maximum-score", "_maxsum_walk"): _maxsum_walk,
+    ("intersection-two-linked-lists", "get_intersection_node"): _get_intersection_node,
+    ("reverse-word-string", "reverse"): _reverse,
+}
+
+# (problem, attribute) of the functions that get a calls/seconds timer
+TIMED: List[Tuple[str, str]] = [
+    ("create-maximum-number", "max_subsequence"),
+    ("create-maximum-number", "merge"),
+    ("create-maximum-number", "max_number"),
+    ("get-maximum-score", "maxsum"),
+    ("intersection-two-linked-lists", "get_intersection_node"),
+    ("next-palindrome-same-digits", "find_next_palindrome"),
+    ("reverse-word-string", "reverse_words"),
+]
+
+_originals: Dict[Tuple[str, str], Callable] = {}
+_stats: Optional[Stats] = None
+
+
+def enable() -> Stats:
+    """Swap the instrumented variants in, and return the Stats they fill."""
+    global _stats
+    if _stats is not None:
+        return _stats
+
+    stats = Stats()
+    for key in dict.fromkeys(list(VARIANTS) + TIMED):
+        problem, attr = key
+        module = load_solution(problem)
+        original = _originals.setdefault(key, getattr(module, attr))
+
+        fn = VARIANTS[key](stats, module) if key in VARIANTS else original
+        if key in TIMED:
+            fn = _timed(stats, attr, fn)
+        setattr(module, attr, fn)
+
+    _stats = stats
+    return stats
+
+
+def disable() -> None:
+    """Restore the original functions; the hot paths are uninstrumented again."""
+    global _stats
+    for (problem, attr), fn in _originals.items():
+        setattr(load_solution(problem), attr, fn)
+    _originals.clear()
+    _stats = None
+
+
+def current() -> Optional[Stats]:
+    """The active Stats, or None while instrumentation is disabled."""
+    return _stats